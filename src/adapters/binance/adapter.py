@@ -88,10 +88,6 @@ class BinanceAdapter(ExchangeAdapter):
         self._rest_futures: Optional[BinanceRestClient] = None
         self._rest_spot: Optional[BinanceRestClient] = None
 
-        # Store base WebSocket URLs (immutable)
-        self._ws_futures_base_url: Optional[str] = None
-        self._ws_spot_base_url: Optional[str] = None
-
         # State tracking
         self._last_sequence_ids: Dict[str, int] = {}  # instrument -> last seq ID
         self._message_count = 0
@@ -134,10 +130,6 @@ class BinanceAdapter(ExchangeAdapter):
         futures_url = self._config.get_websocket_url("futures")
         spot_url = self._config.get_websocket_url("spot")
 
-        # Store base URLs for later use
-        self._ws_futures_base_url = futures_url
-        self._ws_spot_base_url = spot_url
-
         if futures_url:
             self._ws_futures = BinanceWebSocketClient(
                 url=futures_url,
@@ -255,42 +247,17 @@ class BinanceAdapter(ExchangeAdapter):
                     spot_streams.append(symbol_config.ticker_stream)
 
         # Subscribe on appropriate WebSockets
-        # Binance uses combined streams, so we need to build the URL
-        if futures_streams and self._ws_futures and self._ws_futures_base_url:
-            # Build combined stream URL from base URL (not from current URL)
-            combined_stream = "/".join(futures_streams)
-            combined_url = f"{self._ws_futures_base_url}?streams={combined_stream}"
-
-            # Reconnect with new URL
-            await self._ws_futures.disconnect()
-
-            # Create new WebSocket client with combined URL
-            self._ws_futures = BinanceWebSocketClient(
-                url=combined_url,
-                ping_interval=self._config.connection.ping_interval_seconds,
-                ping_timeout=self._config.connection.ping_timeout_seconds,
-                max_reconnect_attempts=self._config.connection.max_reconnect_attempts,
-                reconnect_delay=self._config.connection.reconnect_delay_seconds,
-            )
-            await self._ws_futures.connect()
+        # Binance uses combined streams: every stream for a market type is
+        # multiplexed over one connection built from the base URL
+        if futures_streams and self._ws_futures:
+            self._ws_futures.add_streams(futures_streams)
+            await self._ws_futures.start()
 
             logger.info("binance_subscribed_futures", streams=futures_streams)
 
-        if spot_streams and self._ws_spot and self._ws_spot_base_url:
-            combined_stream = "/".join(spot_streams)
-            combined_url = f"{self._ws_spot_base_url}?streams={combined_stream}"
-
-            await self._ws_spot.disconnect()
-
-            # Create new WebSocket client with combined URL
-            self._ws_spot = BinanceWebSocketClient(
-                url=combined_url,
-                ping_interval=self._config.connection.ping_interval_seconds,
-                ping_timeout=self._config.connection.ping_timeout_seconds,
-                max_reconnect_attempts=self._config.connection.max_reconnect_attempts,
-                reconnect_delay=self._config.connection.reconnect_delay_seconds,
-            )
-            await self._ws_spot.connect()
+        if spot_streams and self._ws_spot:
+            self._ws_spot.add_streams(spot_streams)
+            await self._ws_spot.start()
 
             logger.info("binance_subscribed_spot", streams=spot_streams)
 
@@ -7,7 +7,7 @@ streaming message delivery.
 
 Connection Management:
     - Auto-reconnect with exponential backoff and jitter
-    - Ping/pong heartbeat every 30 seconds
+    - Ping/pong heartbeat every 30 seconds (websockets library keepalive)
     - Connection state tracking
     - Graceful disconnect handling
 
@@ -19,6 +19,7 @@ Stream Format:
 
 import asyncio
 import json
+import os
 import random
 from datetime import datetime, timezone
 from typing import Any, AsyncIterator, Dict, List, Optional
@@ -29,6 +30,27 @@ from websockets.exceptions import ConnectionClosed, WebSocketException
 
 logger = structlog.get_logger(__name__)
 
+# Number of leading bytes/characters of a malformed frame included in logs
+_EXCERPT_LENGTH = 100
+
+
+def _excerpt(raw_message: str | bytes) -> str | bytes:
+    """
+    Return the leading part of a raw frame for logging.
+
+    Binary frames are sliced through a memoryview so only the excerpt is
+    copied, never an intermediate slice of the full frame.
+
+    Args:
+        raw_message: Raw frame as received from the socket.
+
+    Returns:
+        At most ``_EXCERPT_LENGTH`` leading bytes or characters.
+    """
+    if isinstance(raw_message, (bytes, bytearray)):
+        return bytes(memoryview(raw_message)[:_EXCERPT_LENGTH])
+    return raw_message[:_EXCERPT_LENGTH]
+
 
 class BinanceWebSocketClient:
     """
@@ -56,6 +78,24 @@ class BinanceWebSocketClient:
         ...     print(message)
     """
 
+    __slots__ = (
+        "_base_url",
+        "_combined",
+        "_connected",
+        "_last_message_at",
+        "_log",
+        "_reconnect_count",
+        "_rng",
+        "_should_reconnect",
+        "_streams",
+        "_ws",
+        "max_reconnect_attempts",
+        "ping_interval",
+        "ping_timeout",
+        "reconnect_delay",
+        "url",
+    )
+
     def __init__(
         self,
         url: str,
@@ -75,6 +115,8 @@ class BinanceWebSocketClient:
             reconnect_delay: Base delay in seconds for reconnection backoff.
         """
         self.url = url
+        self._base_url = url
+        self._log = logger.bind(url=url)
         self.ping_interval = ping_interval
         self.ping_timeout = ping_timeout
         self.max_reconnect_attempts = max_reconnect_attempts
@@ -85,12 +127,13 @@ class BinanceWebSocketClient:
         self._connected = False
         self._reconnect_count = 0
         self._last_message_at: Optional[datetime] = None
-        self._ping_task: Optional[asyncio.Task] = None
         self._should_reconnect = True
+        self._combined = False
+        # Per-client RNG so concurrent reconnects draw independent jitter
+        self._rng = random.Random(os.urandom(8))
 
-        logger.info(
+        self._log.info(
             "websocket_client_initialized",
-            url=url,
             ping_interval=ping_interval,
             max_attempts=max_reconnect_attempts,
         )
@@ -114,63 +157,54 @@ class BinanceWebSocketClient:
         """
         Establish WebSocket connection.
 
-        Opens the WebSocket connection and starts the ping task.
+        Opens the WebSocket connection. Heartbeats are handled by the
+        websockets library keepalive, which sends a ping every
+        ``ping_interval`` seconds and closes the connection if no pong
+        arrives within ``ping_timeout``.
         Idempotent - does nothing if already connected.
 
         Raises:
             ConnectionError: If connection fails after max retries.
         """
         if self.is_connected:
-            logger.debug("websocket_already_connected", url=self.url)
+            self._log.debug("websocket_already_connected")
             return
 
         try:
             self._ws = await websockets.connect(
                 self.url,
-                ping_interval=None,  # We handle pings manually
-                ping_timeout=None,
+                ping_interval=self.ping_interval,
+                ping_timeout=self.ping_timeout,
                 close_timeout=10,
                 max_size=2**20,  # 1MB max message size
             )
             self._connected = True
 
-            # Start ping task
-            self._ping_task = asyncio.create_task(self._send_pings())
-
-            logger.info(
+            self._log.info(
                 "websocket_connected",
-                url=self.url,
                 reconnect_count=self._reconnect_count,
             )
 
         except Exception as e:
-            logger.error("websocket_connection_failed", url=self.url, error=str(e))
+            self._log.error("websocket_connection_failed", error=str(e))
             raise ConnectionError(f"Failed to connect to Binance WebSocket: {e}")
 
     async def disconnect(self) -> None:
         """
         Gracefully close WebSocket connection.
 
-        Cancels ping task, closes connection, and cleans up resources.
+        Closes connection and cleans up resources.
         Safe to call multiple times.
         """
         self._should_reconnect = False
 
-        # Cancel ping task
-        if self._ping_task and not self._ping_task.done():
-            self._ping_task.cancel()
-            try:
-                await self._ping_task
-            except asyncio.CancelledError:
-                pass
-
         # Close WebSocket
         if self._ws:
             try:
                 await self._ws.close()
-                logger.info("websocket_disconnected", url=self.url)
+                self._log.info("websocket_disconnected")
             except Exception as e:
-                logger.warning("websocket_close_error", url=self.url, error=str(e))
+                self._log.warning("websocket_close_error", error=str(e))
 
         self._connected = False
         self._ws = None
@@ -203,12 +237,59 @@ class BinanceWebSocketClient:
         # Binance combined stream format: /stream?streams=stream1/stream2/stream3
         # The subscription happens via URL, not via message
         # For multi-stream, we need to reconnect with new URL
-        logger.info(
+        self._log.info(
             "websocket_subscribed",
-            url=self.url,
             streams=streams,
         )
 
+    def add_streams(self, streams: List[str]) -> None:
+        """
+        Register streams for the combined-stream connection.
+
+        Does not touch the socket; call ``start()`` to (re)connect with all
+        registered streams multiplexed over a single connection. Streams
+        already registered are ignored.
+
+        Args:
+            streams: List of stream names (e.g., ["btcusdt@depth20@100ms"]).
+        """
+        for stream in streams:
+            if stream not in self._streams:
+                self._streams.append(stream)
+
+    async def start(self) -> None:
+        """
+        Open a single combined-stream connection for all registered streams.
+
+        Builds ``{base_url}?streams=s1/s2/...`` from the streams registered via
+        ``add_streams()`` and (re)connects, replacing any open socket.
+
+        Raises:
+            ConnectionError: If connection fails.
+        """
+        self._combined = bool(self._streams)
+        if self._combined:
+            self.url = f"{self._base_url}?streams={'/'.join(self._streams)}"
+        else:
+            self.url = self._base_url
+        self._log = logger.bind(url=self.url)
+
+        if self._ws:
+            try:
+                await self._ws.close()
+            except Exception as e:
+                self._log.warning("websocket_close_error", error=str(e))
+            self._ws = None
+        self._connected = False
+        self._should_reconnect = True
+
+        await self.connect()
+
+        self._log.info(
+            "websocket_subscribed",
+            streams=self._streams,
+        )
+
     async def stream_messages(self) -> AsyncIterator[Dict[str, Any]]:
         """
         Stream messages from WebSocket.
@@ -229,11 +310,13 @@ class BinanceWebSocketClient:
         """
         while self._should_reconnect:
             try:
-                if not self.is_connected:
+                # Inlined is_connected: avoids property dispatch per frame
+                if not (self._connected and self._ws is not None):
                     await self._reconnect()
 
                 if not self._ws:
-                    await asyncio.sleep(1)
+                    # Reconnect attempt failed; the backoff sleep inside
+                    # _reconnect() already paces the next attempt
                     continue
 
                 # Receive message
@@ -244,23 +327,26 @@ class BinanceWebSocketClient:
                 try:
                     message = json.loads(raw_message)
 
-                    # Binance combined stream wraps messages in "stream" and "data"
-                    if "stream" in message and "data" in message:
+                    # Binance combined stream wraps messages in "stream" and "data".
+                    # On a start()-built combined connection every frame is
+                    # wrapped, so a single probe replaces both membership tests.
+                    if self._combined:
+                        yield message.get("data", message)
+                    elif "stream" in message and "data" in message:
                         yield message["data"]
                     else:
                         yield message
 
                 except json.JSONDecodeError as e:
-                    logger.warning(
+                    self._log.warning(
                         "websocket_invalid_json",
-                        url=self.url,
                         error=str(e),
-                        message=raw_message[:100],
+                        message=_excerpt(raw_message),
                     )
                     continue
 
             except ConnectionClosed:
-                logger.warning("websocket_connection_closed", url=self.url)
+                self._log.warning("websocket_connection_closed")
                 self._connected = False
                 if self._should_reconnect:
                     await self._reconnect()
@@ -268,7 +354,7 @@ class BinanceWebSocketClient:
                     break
 
             except WebSocketException as e:
-                logger.error("websocket_error", url=self.url, error=str(e))
+                self._log.error("websocket_error", error=str(e))
                 self._connected = False
                 if self._should_reconnect:
                     await self._reconnect()
@@ -276,13 +362,12 @@ class BinanceWebSocketClient:
                     break
 
             except asyncio.CancelledError:
-                logger.info("websocket_stream_cancelled", url=self.url)
+                self._log.info("websocket_stream_cancelled")
                 break
 
             except Exception as e:
-                logger.error(
+                self._log.error(
                     "websocket_unexpected_error",
-                    url=self.url,
                     error=str(e),
                     error_type=type(e).__name__,
                 )
@@ -299,9 +384,8 @@ class BinanceWebSocketClient:
             ConnectionError: If max reconnection attempts exceeded.
         """
         if self._reconnect_count >= self.max_reconnect_attempts:
-            logger.error(
+            self._log.error(
                 "websocket_max_reconnect_exceeded",
-                url=self.url,
                 max_attempts=self.max_reconnect_attempts,
             )
             raise ConnectionError(
@@ -314,12 +398,11 @@ class BinanceWebSocketClient:
         attempt = self._reconnect_count
 
         delay = min(base_delay * (2**attempt), max_delay)
-        jitter = random.uniform(0, delay * 0.1)
+        jitter = self._rng.random() * delay * 0.1
         total_delay = delay + jitter
 
-        logger.info(
+        self._log.info(
             "websocket_reconnecting",
-            url=self.url,
             attempt=attempt + 1,
             max_attempts=self.max_reconnect_attempts,
             delay_seconds=total_delay,
@@ -335,57 +418,20 @@ class BinanceWebSocketClient:
             if self._streams:
                 await self.subscribe(self._streams)
 
-            logger.info(
+            self._log.info(
                 "websocket_reconnected",
-                url=self.url,
                 reconnect_count=self._reconnect_count,
             )
 
         except Exception as e:
-            logger.error(
+            self._log.error(
                 "websocket_reconnect_failed",
-                url=self.url,
                 attempt=attempt + 1,
                 error=str(e),
             )
             self._reconnect_count += 1
             # Will retry on next iteration
 
-    async def _send_pings(self) -> None:
-        """
-        Send periodic ping messages.
-
-        Binance expects pong responses to ping frames. This task sends
-        pings at the configured interval to keep the connection alive.
-        """
-        try:
-            while self.is_connected:
-                await asyncio.sleep(self.ping_interval)
-
-                if self._ws:
-                    try:
-                        pong_waiter = await self._ws.ping()
-                        await asyncio.wait_for(pong_waiter, timeout=self.ping_timeout)
-                        logger.debug("websocket_ping_success", url=self.url)
-                    except asyncio.TimeoutError:
-                        logger.warning(
-                            "websocket_ping_timeout",
-                            url=self.url,
-                            timeout=self.ping_timeout,
-                        )
-                        self._connected = False
-                        break
-                    except Exception as e:
-                        logger.error(
-                            "websocket_ping_error", url=self.url, error=str(e)
-                        )
-                        break
-
-        except asyncio.CancelledError:
-            logger.debug("websocket_ping_task_cancelled", url=self.url)
-        except Exception as e:
-            logger.error("websocket_ping_task_error", url=self.url, error=str(e))
-
     def __repr__(self) -> str:
         """Return string representation."""
         return (
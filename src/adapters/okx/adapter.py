@@ -16,7 +16,7 @@ OKX-Specific Details:
     - Single WebSocket endpoint handles all instruments
     - Uses JSON subscription messages
     - Sequence tracking per instrument using seqId
-    - String-based ping/pong heartbeat
+    - Protocol keepalive with string ping/pong when idle
 
 Example:
     >>> from src.adapters.okx import OKXAdapter
@@ -34,14 +34,36 @@ Example:
     ...     print(f"{snapshot.instrument}: {snapshot.spread_bps} bps")
 """
 
-from collections import deque
+import asyncio
+import functools
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import AsyncIterator, Dict, List, Optional
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Concatenate,
+    Coroutine,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    ParamSpec,
+    Tuple,
+    TypeVar,
+)
 
 import structlog
 
-from src.adapters.okx.normalizer import OKXNormalizer
+from src.adapters.okx.normalizer import (
+    normalize_instrument_id,
+    normalize_orderbook,
+    normalize_ticker,
+    to_okx_instrument_id,
+)
 from src.adapters.okx.rest import OKXRestClient
 from src.adapters.okx.websocket import OKXWebSocketClient
 from src.config.models import ExchangeConfig, InstrumentConfig
@@ -52,6 +74,71 @@ from src.models.ticker import TickerSnapshot
 
 logger = structlog.get_logger(__name__)
 
+# Window over which gaps are counted for health reporting
+_GAP_WINDOW_SECONDS = 3600.0
+# How often expired gaps are pruned while connected
+_GAP_PRUNE_INTERVAL_SECONDS = 60.0
+# Minimum seconds between repeated per-message log events per instrument
+_LOG_INTERVAL_SECONDS = 1.0
+
+_ZERO_DECIMAL = Decimal(0)
+
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+def _require_connected(
+    fn: Callable[Concatenate["OKXAdapter", _P], Awaitable[_T]],
+) -> Callable[Concatenate["OKXAdapter", _P], Coroutine[Any, Any, _T]]:
+    """Fail fast with ConnectionError when the adapter is not connected."""
+    error = f"Cannot {fn.__name__}: not connected"
+
+    @functools.wraps(fn)
+    async def wrapper(self: "OKXAdapter", /, *args: _P.args, **kwargs: _P.kwargs) -> _T:
+        if not self.is_connected:
+            raise ConnectionError(error)
+        return await fn(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _require_connected_stream(
+    fn: Callable[Concatenate["OKXAdapter", _P], AsyncIterator[_T]],
+) -> Callable[Concatenate["OKXAdapter", _P], AsyncIterator[_T]]:
+    """
+    Async generator counterpart of ``_require_connected``.
+
+    The check runs when iteration starts, as an inline guard at the top of
+    the generator body would.
+    """
+    error = f"Cannot {fn.__name__}: not connected"
+
+    @functools.wraps(fn)
+    async def wrapper(
+        self: "OKXAdapter", /, *args: _P.args, **kwargs: _P.kwargs
+    ) -> AsyncIterator[_T]:
+        if not self.is_connected:
+            raise ConnectionError(error)
+        async for item in fn(self, *args, **kwargs):
+            yield item
+
+    return wrapper
+
+
+class _BoundedCache(OrderedDict[str, Dict[str, Any]]):
+    """Dict that evicts its least recently written entry beyond ``maxsize``."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key: str, value: Dict[str, Any]) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
 
 class OKXAdapter(ExchangeAdapter):
     """
@@ -85,6 +172,30 @@ class OKXAdapter(ExchangeAdapter):
         """
         self._config = exchange_config
         self._instruments = instruments
+        self._instrument_by_id: Dict[str, InstrumentConfig] = {
+            i.id: i for i in instruments
+        }
+
+        # Normalized -> OKX instrument ID (memoized normalizer calls)
+        self._norm_to_okx: Dict[str, str] = {
+            i.id: to_okx_instrument_id(i.id) for i in instruments
+        }
+
+        # Subscribed OKX instrument ID -> normalized ID, filled by subscribe()
+        # and read once per message
+        self._resolve: Dict[str, str] = {}
+
+        # Subscription data for instruments listed on OKX:
+        # normalized id -> (OKX instrument id, is perpetual)
+        self._okx_instruments: Dict[str, Tuple[str, bool]] = {
+            i.id: (self._norm_to_okx[i.id], i.is_perpetual)
+            for i in instruments
+            if i.get_exchange_symbol("okx")
+        }
+
+        # Channel names (resolved once, read per message)
+        self._orderbook_channel = exchange_config.streams.orderbook_channel or "books5"
+        self._ticker_channel = exchange_config.streams.ticker_channel or "tickers"
 
         # WebSocket client (single for all instruments)
         self._ws: Optional[OKXWebSocketClient] = None
@@ -96,11 +207,24 @@ class OKXAdapter(ExchangeAdapter):
         self._last_sequence_ids: Dict[str, int] = {}  # instrument -> last seq ID
         self._message_count = 0
         self._reconnect_count = 0
-        self._gaps_last_hour: deque = deque(maxlen=3600)  # Track gaps
-
-        # Ticker cache (for combining ticker with mark price)
-        self._ticker_cache: Dict[str, Dict] = {}
-        self._mark_price_cache: Dict[str, Dict] = {}
+        self._gap_times: Deque[float] = deque()  # Monotonic times of recent gaps
+        self._gap_prune_handle: Optional[asyncio.TimerHandle] = None
+
+        # Per-message log rate limiting: (event, instrument) -> state
+        self._last_log_at: Dict[Tuple[str, str], float] = {}
+        self._suppressed_logs: Dict[Tuple[str, str], int] = {}
+
+        # Ticker cache (for combining ticker with mark price), bounded to
+        # room for spot + perpetual entries per configured instrument
+        cache_size = max(2 * len(instruments), 1)
+        self._ticker_cache: _BoundedCache = _BoundedCache(cache_size)
+        self._mark_price_cache: _BoundedCache = _BoundedCache(cache_size)
+        # OKX instrument ID -> (ticker ts, markPx) of the last emitted ticker
+        self._last_emitted_ticker: Dict[str, Tuple[Any, Any]] = {}
+        self._ticker_dispatch: Dict[str, _BoundedCache] = {
+            self._ticker_channel: self._ticker_cache,
+            "mark-price": self._mark_price_cache,
+        }
 
         logger.info(
             "okx_adapter_initialized",
@@ -115,7 +239,8 @@ class OKXAdapter(ExchangeAdapter):
     @property
     def is_connected(self) -> bool:
         """Check if WebSocket is connected."""
-        return bool(self._ws and self._ws.is_connected)
+        ws = self._ws
+        return ws is not None and ws.is_connected
 
     async def connect(self) -> None:
         """
@@ -139,6 +264,7 @@ class OKXAdapter(ExchangeAdapter):
             ping_timeout=self._config.connection.ping_timeout_seconds,
             max_reconnect_attempts=self._config.connection.max_reconnect_attempts,
             reconnect_delay=self._config.connection.reconnect_delay_seconds,
+            subscribe_batch_size=self._config.streams.subscribe_batch_size,
         )
         await self._ws.connect()
 
@@ -150,18 +276,32 @@ class OKXAdapter(ExchangeAdapter):
                 rate_limit_per_second=self._config.connection.rate_limit_per_second,
             )
 
+        # Expire old gaps off the hot path
+        if self._gap_prune_handle is None:
+            self._schedule_gap_prune()
+
         logger.info("okx_connected", ws_url=ws_url, rest_url=rest_url)
 
     async def disconnect(self) -> None:
         """Gracefully disconnect all connections."""
+        if self._gap_prune_handle is not None:
+            self._gap_prune_handle.cancel()
+            self._gap_prune_handle = None
+
         if self._ws:
             await self._ws.disconnect()
 
         if self._rest:
             await self._rest.close()
 
+        # Drop cached ticker state so a later session starts clean
+        self._ticker_cache.clear()
+        self._mark_price_cache.clear()
+        self._last_emitted_ticker.clear()
+
         logger.info("okx_disconnected")
 
+    @_require_connected
     async def subscribe(self, instruments: List[str]) -> None:
         """
         Subscribe to market data for specified instruments.
@@ -173,47 +313,37 @@ class OKXAdapter(ExchangeAdapter):
             ConnectionError: If not connected.
             ValueError: If instrument not found in configuration.
         """
-        if not self.is_connected:
-            raise ConnectionError("Cannot subscribe: not connected")
-
         # Build subscription channels
         channels = []
 
         for instrument_id in instruments:
-            # Find instrument config
-            instrument = next(
-                (i for i in self._instruments if i.id == instrument_id), None
-            )
-            if not instrument:
-                raise ValueError(f"Instrument not found: {instrument_id}")
-
-            # Get OKX symbol config
-            symbol_config = instrument.get_exchange_symbol("okx")
-            if not symbol_config:
+            okx_instrument = self._okx_instruments.get(instrument_id)
+            if okx_instrument is None:
+                if instrument_id not in self._instrument_by_id:
+                    raise ValueError(f"Instrument not found: {instrument_id}")
                 raise ValueError(
                     f"OKX symbol config not found for {instrument_id}"
                 )
 
-            # Get OKX instrument ID
-            okx_inst_id = OKXNormalizer.to_okx_instrument_id(instrument_id)
+            okx_inst_id, is_perpetual = okx_instrument
+            self._resolve[okx_inst_id] = instrument_id
 
             # Subscribe to order book channel
-            orderbook_channel = self._config.streams.orderbook_channel
-            channels.append({"channel": orderbook_channel, "instId": okx_inst_id})
+            channels.append({"channel": self._orderbook_channel, "instId": okx_inst_id})
 
             # Subscribe to ticker channel (default to "tickers")
-            ticker_channel = getattr(self._config.streams, "ticker_channel", "tickers")
-            channels.append({"channel": ticker_channel, "instId": okx_inst_id})
+            channels.append({"channel": self._ticker_channel, "instId": okx_inst_id})
 
             # Subscribe to mark price channel for perpetuals
-            if instrument.is_perpetual:
+            if is_perpetual:
                 channels.append({"channel": "mark-price", "instId": okx_inst_id})
 
-        # Subscribe via WebSocket
+        # Subscribe via WebSocket (sent in batches of subscribe_batch_size)
         await self._ws.subscribe(channels)
 
-        logger.info("okx_subscribed", channels=channels)
+        logger.info("okx_subscribed", instruments=len(instruments), channels=len(channels))
 
+    @_require_connected_stream
     async def stream_order_books(self) -> AsyncIterator[OrderBookSnapshot]:
         """
         Stream order book snapshots from WebSocket.
@@ -224,85 +354,79 @@ class OKXAdapter(ExchangeAdapter):
         Yields:
             OrderBookSnapshot: Normalized order book snapshot.
         """
-        if not self._ws:
-            raise ConnectionError("WebSocket not initialized")
+        # Bind per-message lookups to locals once
+        resolve = self._resolve
+        last_sequence_ids = self._last_sequence_ids
 
-        async for message in self._ws.stream_messages():
-            # Filter for order book updates
-            arg = message.get("arg", {})
-            channel = arg.get("channel")
+        async for message in self._channel_messages(self._orderbook_channel):
+            # The channel router only delivers messages carrying an "arg"
+            arg = message["arg"]
 
-            if channel != self._config.streams.orderbook_channel:
+            # Get OKX instrument ID
+            okx_inst_id = arg.get("instId")
+            if not okx_inst_id:
+                logger.warning("okx_missing_inst_id", arg=arg)
                 continue
 
-            try:
-                # Get OKX instrument ID
-                okx_inst_id = arg.get("instId")
-                if not okx_inst_id:
-                    logger.warning("okx_missing_inst_id", message=message)
-                    continue
-
-                # Normalize instrument ID
-                instrument_id = OKXNormalizer.normalize_instrument_id(okx_inst_id)
-
-                # Find instrument config
-                instrument = next(
-                    (i for i in self._instruments if i.id == instrument_id), None
+            # Resolve the normalized ID of a subscribed instrument
+            instrument_id = resolve.get(okx_inst_id)
+            if instrument_id is None:
+                logger.warning(
+                    "okx_unknown_instrument",
+                    okx_inst_id=okx_inst_id,
+                    instrument_id=normalize_instrument_id(okx_inst_id),
                 )
-                if not instrument:
-                    logger.warning(
-                        "okx_unknown_instrument",
-                        okx_inst_id=okx_inst_id,
-                        instrument_id=instrument_id,
-                    )
-                    continue
+                continue
 
+            # Only normalization and gap detection can realistically fail
+            try:
                 # Normalize to OrderBookSnapshot
-                snapshot = OKXNormalizer.normalize_orderbook(
+                snapshot = normalize_orderbook(
                     raw_message=message,
                     instrument=instrument_id,
                 )
 
                 # Detect gaps
                 gap = self.detect_gap(
-                    prev_seq=self._last_sequence_ids.get(instrument_id),
+                    prev_seq=last_sequence_ids.get(instrument_id),
                     curr_seq=snapshot.sequence_id,
+                    instrument=instrument_id,
                 )
 
-                if gap:
-                    # Enhance gap with instrument info
-                    gap = GapMarker(
-                        exchange=self.exchange_name,
+            except Exception as e:
+                suppressed = self._log_allowed("okx_orderbook_processing_error", instrument_id)
+                if suppressed is not None:
+                    logger.error(
+                        "okx_orderbook_processing_error",
                         instrument=instrument_id,
-                        gap_start=gap.gap_start,
-                        gap_end=gap.gap_end,
-                        duration_seconds=gap.duration_seconds,
-                        reason="sequence_gap",
-                        sequence_id_before=gap.sequence_id_before,
-                        sequence_id_after=gap.sequence_id_after,
+                        error=str(e),
+                        arg=arg,
+                        size=len(message.get("data") or ()),
+                        sample=str(message)[:200],
+                        suppressed=suppressed,
                     )
-                    self._gaps_last_hour.append(gap)
+                continue
+
+            if gap:
+                self._record_gap()
 
+                suppressed = self._log_allowed("okx_gap_detected", instrument_id)
+                if suppressed is not None:
                     logger.warning(
                         "okx_gap_detected",
                         instrument=instrument_id,
                         gap_size=gap.sequence_gap_size,
                         prev_seq=gap.sequence_id_before,
                         curr_seq=gap.sequence_id_after,
+                        suppressed=suppressed,
                     )
 
-                self._last_sequence_ids[instrument_id] = snapshot.sequence_id
-                self._message_count += 1
+            last_sequence_ids[instrument_id] = snapshot.sequence_id
+            self._message_count += 1
 
-                yield snapshot
-
-            except Exception as e:
-                logger.error(
-                    "okx_orderbook_processing_error",
-                    error=str(e),
-                    message=message,
-                )
+            yield snapshot
 
+    @_require_connected_stream
     async def stream_tickers(self) -> AsyncIterator[TickerSnapshot]:
         """
         Stream ticker snapshots from WebSocket.
@@ -313,68 +437,99 @@ class OKXAdapter(ExchangeAdapter):
         Yields:
             TickerSnapshot: Normalized ticker snapshot.
         """
-        if not self._ws:
-            raise ConnectionError("WebSocket not initialized")
-
-        async for message in self._ws.stream_messages():
-            arg = message.get("arg", {})
-            channel = arg.get("channel")
-
-            # Cache ticker data
-            if channel == self._config.streams.ticker_channel:
-                okx_inst_id = arg.get("instId")
-                if okx_inst_id:
-                    data_array = message.get("data", [])
-                    if data_array:
-                        self._ticker_cache[okx_inst_id] = data_array[0]
-
-            # Cache mark price data (perpetuals only)
-            elif channel == "mark-price":
-                okx_inst_id = arg.get("instId")
-                if okx_inst_id:
-                    data_array = message.get("data", [])
-                    if data_array:
-                        self._mark_price_cache[okx_inst_id] = data_array[0]
-
-            # Only yield when we have ticker data
-            if channel not in (self._config.streams.ticker_channel, "mark-price"):
-                continue
+        # Bind per-message lookups to locals once
+        resolve = self._resolve
+        ticker_dispatch = self._ticker_dispatch
+        ticker_cache = self._ticker_cache
+        mark_price_cache = self._mark_price_cache
+        last_emitted_ticker = self._last_emitted_ticker
+
+        async for message in self._channel_messages(*ticker_dispatch):
+            # The channel router only delivers ticker / mark price messages,
+            # each carrying an "arg" with its channel
+            arg = message["arg"]
+
+            # Route ticker / mark price (perpetuals only) data to its cache
+            cache = ticker_dispatch[arg["channel"]]
 
             okx_inst_id = arg.get("instId")
             if not okx_inst_id:
                 continue
 
-            # Normalize instrument ID
-            instrument_id = OKXNormalizer.normalize_instrument_id(okx_inst_id)
-
-            # Find instrument config
-            instrument = next(
-                (i for i in self._instruments if i.id == instrument_id), None
-            )
-            if not instrument:
+            # Resolve the normalized ID of a subscribed instrument first, so
+            # unsubscribed traffic cannot evict entries from the bounded cache
+            instrument_id = resolve.get(okx_inst_id)
+            if instrument_id is None:
                 continue
 
+            data_array = message.get("data")
+            if data_array:
+                cache[okx_inst_id] = data_array[0]
+
             # Get cached data
-            ticker_data = self._ticker_cache.get(okx_inst_id)
-            mark_price_data = self._mark_price_cache.get(okx_inst_id)
+            ticker_data = ticker_cache.get(okx_inst_id)
+            mark_price_data = mark_price_cache.get(okx_inst_id)
 
             if not ticker_data:
                 continue
 
+            # Skip re-normalizing when neither the ticker nor the mark price
+            # changed since the last emitted snapshot (e.g. periodic
+            # mark-price pushes with an unchanged markPx)
+            emit_key = (
+                ticker_data.get("ts"),
+                mark_price_data.get("markPx") if mark_price_data else None,
+            )
+            if last_emitted_ticker.get(okx_inst_id) == emit_key:
+                continue
+
             try:
-                ticker = OKXNormalizer.normalize_ticker(
+                ticker = normalize_ticker(
                     raw_ticker=ticker_data,
                     raw_mark_price=mark_price_data,
                     instrument=instrument_id,
                 )
-                yield ticker
-
             except Exception as e:
                 logger.error(
                     "okx_ticker_processing_error",
                     instrument=instrument_id,
                     error=str(e),
                 )
+                continue
+
+            last_emitted_ticker[okx_inst_id] = emit_key
+            yield ticker
+
+    async def _channel_messages(self, *channels: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over the WebSocket messages of the given channels.
+
+        Each caller gets its own queue from the client's channel router, so
+        concurrent order book and ticker streams share one socket read and
+        never see each other's messages.
+
+        Args:
+            *channels: OKX channel names.
+
+        Yields:
+            Dict[str, Any]: Parsed message for one of the channels.
+
+        Raises:
+            Exception: The error that stopped the client's stream, e.g.
+                ConnectionError once reconnection attempts are exhausted.
+        """
+        ws = self._ws
+        if ws is None:
+            raise ConnectionError("Cannot stream: not connected")
+        queue = ws.subscribe_channel(*channels)
+        try:
+            while (message := await queue.get()) is not None:
+                yield message
+        finally:
+            ws.unsubscribe_channel(queue)
+
+        if ws.stream_error is not None:
+            raise ws.stream_error
 
     async def get_order_book_rest(self, instrument: str) -> OrderBookSnapshot:
         """
@@ -394,14 +549,12 @@ class OKXAdapter(ExchangeAdapter):
             raise ConnectionError("REST client not initialized")
 
         # Find instrument config
-        instrument_config = next(
-            (i for i in self._instruments if i.id == instrument), None
-        )
+        instrument_config = self._instrument_by_id.get(instrument)
         if not instrument_config:
             raise ValueError(f"Instrument not found: {instrument}")
 
         # Get OKX instrument ID
-        okx_inst_id = OKXNormalizer.to_okx_instrument_id(instrument)
+        okx_inst_id = self._norm_to_okx[instrument]
 
         return await self._rest.get_orderbook(
             inst_id=okx_inst_id,
@@ -423,18 +576,17 @@ class OKXAdapter(ExchangeAdapter):
             raise ConnectionError("REST client not initialized")
 
         # Find instrument config
-        instrument_config = next(
-            (i for i in self._instruments if i.id == instrument), None
-        )
+        instrument_config = self._instrument_by_id.get(instrument)
         if not instrument_config:
             raise ValueError(f"Instrument not found: {instrument}")
 
         # Get OKX instrument ID
-        okx_inst_id = OKXNormalizer.to_okx_instrument_id(instrument)
+        okx_inst_id = self._norm_to_okx[instrument]
 
         return await self._rest.get_ticker(
             inst_id=okx_inst_id,
             instrument=instrument,
+            is_perpetual=instrument_config.is_perpetual,
         )
 
     async def health_check(self) -> HealthStatus:
@@ -460,9 +612,7 @@ class OKXAdapter(ExchangeAdapter):
         # Calculate lag
         lag_ms = 0
         if last_message_at:
-            lag_ms = int(
-                (datetime.now(timezone.utc) - last_message_at).total_seconds() * 1000
-            )
+            lag_ms = int((time.time() - last_message_at.timestamp()) * 1000)
 
         # Get reconnect count
         reconnect_count = 0
@@ -476,11 +626,11 @@ class OKXAdapter(ExchangeAdapter):
             message_count=self._message_count,
             lag_ms=lag_ms,
             reconnect_count=reconnect_count,
-            gaps_last_hour=len(self._gaps_last_hour),
+            gaps_last_hour=self._recent_gap_count(),
         )
 
     def detect_gap(
-        self, prev_seq: Optional[int], curr_seq: int
+        self, prev_seq: Optional[int], curr_seq: int, instrument: str = "UNKNOWN"
     ) -> Optional[GapMarker]:
         """
         Detect sequence gap.
@@ -497,6 +647,7 @@ class OKXAdapter(ExchangeAdapter):
         Args:
             prev_seq: Previous sequence ID (seqId).
             curr_seq: Current sequence ID.
+            instrument: Normalized instrument ID recorded on the gap marker.
 
         Returns:
             Optional[GapMarker]: Gap marker if gap detected (backwards/duplicate).
@@ -517,10 +668,10 @@ class OKXAdapter(ExchangeAdapter):
 
             return GapMarker(
                 exchange=self.exchange_name,
-                instrument="UNKNOWN",  # Will be filled by caller
+                instrument=instrument,
                 gap_start=now,
                 gap_end=now,
-                duration_seconds=Decimal("0"),
+                duration_seconds=_ZERO_DECIMAL,
                 reason=reason,
                 sequence_id_before=prev_seq,
                 sequence_id_after=curr_seq,
@@ -531,6 +682,49 @@ class OKXAdapter(ExchangeAdapter):
         # as we only see updates affecting top 5 levels
         return None
 
+    def _log_allowed(self, event: str, instrument: str) -> Optional[int]:
+        """
+        Rate-limit a per-message log event to one per instrument per interval.
+
+        Args:
+            event: Log event name.
+            instrument: Normalized instrument ID.
+
+        Returns:
+            Optional[int]: Number of events suppressed since the last emitted
+                one if this event may be logged, None if it should be dropped.
+        """
+        key = (event, instrument)
+        now = time.monotonic()
+        if now - self._last_log_at.get(key, float("-inf")) < _LOG_INTERVAL_SECONDS:
+            self._suppressed_logs[key] = self._suppressed_logs.get(key, 0) + 1
+            return None
+
+        self._last_log_at[key] = now
+        return self._suppressed_logs.pop(key, 0)
+
+    def _record_gap(self) -> None:
+        """Record a gap occurrence for the rolling one-hour window."""
+        self._gap_times.append(time.monotonic())
+
+    def _prune_gaps(self, now: float) -> None:
+        """Drop gap timestamps older than the one-hour window."""
+        gap_times = self._gap_times
+        while gap_times and now - gap_times[0] > _GAP_WINDOW_SECONDS:
+            gap_times.popleft()
+
+    def _schedule_gap_prune(self) -> None:
+        """Prune expired gaps now and re-arm the periodic prune timer."""
+        self._prune_gaps(time.monotonic())
+        self._gap_prune_handle = asyncio.get_running_loop().call_later(
+            _GAP_PRUNE_INTERVAL_SECONDS, self._schedule_gap_prune
+        )
+
+    def _recent_gap_count(self) -> int:
+        """Return the number of gaps in the last hour."""
+        self._prune_gaps(time.monotonic())
+        return len(self._gap_times)
+
     def _has_recent_gaps(self) -> bool:
         """Check if there are significant gaps in the last hour."""
-        return len(self._gaps_last_hour) >= 5
+        return self._recent_gap_count() >= 5
@@ -63,8 +63,12 @@ Instrument ID Mapping:
     BTC-USDT → BTC-USDT-SPOT
 """
 
-from datetime import datetime, timezone
-from decimal import Decimal
+import os
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import pairwise
+from operator import itemgetter
+from decimal import Decimal, InvalidOperation
 from typing import Any, Dict, List, Optional
 
 import structlog
@@ -74,282 +78,444 @@ from src.models.ticker import TickerSnapshot
 
 logger = structlog.get_logger(__name__)
 
+# Instrument ID mapping: OKX format -> Our format
+_INSTRUMENT_MAPPING = {
+    "BTC-USDT-SWAP": "BTC-USDT-PERP",
+    "BTC-USDT": "BTC-USDT-SPOT",
+}
 
-class OKXNormalizer:
+# Reverse mapping: Our format -> OKX format
+_REVERSE_INSTRUMENT_MAPPING = {v: k for k, v in _INSTRUMENT_MAPPING.items()}
+
+
+# Re-sort book sides that arrive out of order. Off by default: OKX sends
+# sides pre-sorted and OrderBookSnapshot's validator rejects a misordered
+# book anyway. Set OKX_VALIDATE_SORT=1 to repair such books instead.
+_VALIDATE_SORT = os.environ.get("OKX_VALIDATE_SORT") == "1"
+
+# Fixed-schema field extractors: one C-level call per payload instead of a
+# dict lookup per field. Raise KeyError naming the first missing field.
+_TICKER_FIELDS = itemgetter("ts", "last", "high24h", "low24h", "vol24h", "volCcy24h")
+_MARK_PRICE_FIELDS = itemgetter("markPx", "idxPx", "fundingRate")
+# Book level: [price, quantity, deprecated, num_orders]
+_LEVEL_FIELDS = itemgetter(0, 1)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _ms_to_datetime(timestamp_ms: int) -> datetime:
     """
-    Normalizes OKX data to unified models.
+    Convert an OKX millisecond epoch timestamp to an aware UTC datetime.
 
-    Handles conversion from OKX-specific formats to our standardized
-    OrderBookSnapshot and TickerSnapshot models. All financial values are
-    converted to Decimal for precision.
+    Epoch-plus-timedelta arithmetic is done in C without the gmtime call
+    and float division of ``datetime.fromtimestamp``, and is exact to the
+    millisecond.
+    """
+    return _EPOCH + timedelta(milliseconds=timestamp_ms)
+
+
+@lru_cache(maxsize=8192)
+def _to_decimal(value: str) -> Decimal:
+    """
+    Convert an OKX numeric string to Decimal, memoized on the raw string.
+
+    Book updates repeat the same price and size strings constantly; Decimal
+    is immutable, so repeats can share one instance instead of re-parsing.
+    """
+    return Decimal(value)
+
+
+@lru_cache(maxsize=8192)
+def _to_price(value: str) -> Decimal:
+    """
+    Convert an OKX price string to Decimal, memoized like ``_to_decimal``.
+
+    Levels are built without field validation, so this enforces the
+    ``PriceLevel.price`` constraint instead: finite and not negative.
+
+    Raises:
+        ValueError: If the price is negative or not finite.
+    """
+    price = Decimal(value)
+    if not price.is_finite() or price < 0:
+        raise ValueError(f"Invalid price level: {value}")
+    return price
+
+
+@lru_cache(maxsize=8192)
+def _to_quantity(value: str) -> Decimal:
+    """
+    Convert an OKX quantity string to Decimal, memoized like ``_to_decimal``.
+
+    Enforces the finite part of the ``PriceLevel.quantity`` constraint;
+    ``_parse_levels`` drops zero and negative quantities itself.
+
+    Raises:
+        ValueError: If the quantity is not finite.
+    """
+    quantity = Decimal(value)
+    if not quantity.is_finite():
+        raise ValueError(f"Invalid level quantity: {value}")
+    return quantity
+
+
+def _parse_levels(raw_levels: List[List[str]]) -> List[PriceLevel]:
+    """
+    Parse OKX price levels, dropping zero-quantity levels.
+
+    Single parsing path for order book sides shared by the WebSocket and
+    REST code. Values stay ``Decimal``: the C-backed decimal module parses
+    OKX's short price strings directly and every downstream model and
+    metric is ``Decimal``-typed.
+
+    Args:
+        raw_levels: OKX levels as ``[price, quantity, deprecated, num_orders]``.
+
+    Returns:
+        List[PriceLevel]: Parsed levels in feed order.
+
+    Raises:
+        decimal.InvalidOperation: If a price or quantity is not numeric.
+        ValueError: If a price is negative or not finite, or a quantity is
+            not finite.
+    """
+    # Bind the converters and constructor once; the comprehension body then
+    # uses closure loads instead of a global lookup per level. Values are
+    # already Decimals, so levels are built with model_construct and skip
+    # PriceLevel field validation; _to_price and _to_quantity reject the
+    # values that validation would have rejected.
+    to_quantity = _to_quantity
+    to_price = _to_price
+    price_level = PriceLevel.model_construct
+    # Single pass per side: itemgetter unpacks (price, quantity) in C, and
+    # the price is only converted for levels that survive the filter.
+    # Zero quantity levels are skipped; with validation skipped this also
+    # keeps a malformed negative size out of the book.
+    return [
+        price_level(price=to_price(price), quantity=quantity)
+        for price, raw_quantity in map(_LEVEL_FIELDS, raw_levels)
+        if (quantity := to_quantity(raw_quantity)) > 0
+    ]
+
+
+def _ensure_sorted(levels: List[PriceLevel], descending: bool) -> None:
+    """
+    Sort levels by price in place, but only if they are out of order.
+
+    OKX sends book sides pre-sorted, so a linear check that stops at the
+    first misordered pair replaces an unconditional O(n log n) sort. The
+    check only runs when OKX_VALIDATE_SORT=1; otherwise the feed order is
+    trusted and left to OrderBookSnapshot validation.
+
+    Args:
+        levels: Parsed levels of one book side.
+        descending: True for bids (best = highest), False for asks.
+    """
+    if not _VALIDATE_SORT:
+        return
+
+    prices = [level.price for level in levels]
+    if descending:
+        in_order = all(a >= b for a, b in pairwise(prices))
+    else:
+        in_order = all(a <= b for a, b in pairwise(prices))
+    if not in_order:
+        levels.sort(key=lambda x: x.price, reverse=descending)
+
+
+def normalize_instrument_id(okx_inst_id: str) -> str:
+    """
+    Normalize OKX instrument ID to our format.
+
+    Args:
+        okx_inst_id: OKX instrument ID (e.g., "BTC-USDT-SWAP").
+
+    Returns:
+        str: Normalized instrument ID (e.g., "BTC-USDT-PERP").
 
     Example:
-        >>> normalizer = OKXNormalizer()
-        >>> snapshot = normalizer.normalize_orderbook(
-        ...     raw_message=okx_books_message,
+        >>> normalize_instrument_id("BTC-USDT-SWAP")
+        'BTC-USDT-PERP'
+    """
+    return _INSTRUMENT_MAPPING.get(okx_inst_id, okx_inst_id)
+
+
+def to_okx_instrument_id(normalized_id: str) -> str:
+    """
+    Convert our normalized instrument ID to OKX format.
+
+    Args:
+        normalized_id: Our instrument ID (e.g., "BTC-USDT-PERP").
+
+    Returns:
+        str: OKX instrument ID (e.g., "BTC-USDT-SWAP").
+
+    Example:
+        >>> to_okx_instrument_id("BTC-USDT-PERP")
+        'BTC-USDT-SWAP'
+    """
+    return _REVERSE_INSTRUMENT_MAPPING.get(normalized_id, normalized_id)
+
+
+def normalize_orderbook(
+    raw_message: Dict[str, Any],
+    instrument: str,
+    local_timestamp: Optional[datetime] = None,
+) -> OrderBookSnapshot:
+    """
+    Normalize OKX order book update to OrderBookSnapshot.
+
+    Args:
+        raw_message: Raw OKX books channel message.
+        instrument: Normalized instrument ID (e.g., "BTC-USDT-PERP").
+        local_timestamp: Receipt time to record; defaults to now (UTC).
+
+    Returns:
+        OrderBookSnapshot: Normalized order book.
+
+    Raises:
+        ValueError: If message format is invalid.
+        KeyError: If required fields are missing.
+
+    Example:
+        >>> snapshot = normalize_orderbook(
+        ...     raw_message={
+        ...         "arg": {"channel": "books", "instId": "BTC-USDT-SWAP"},
+        ...         "data": [{
+        ...             "asks": [["50001.0", "1.5", "0", "2"]],
+        ...             "bids": [["50000.0", "2.0", "0", "3"]],
+        ...             "ts": "1234567890123",
+        ...             "seqId": 123456789
+        ...         }]
+        ...     },
         ...     instrument="BTC-USDT-PERP"
         ... )
-        >>> print(f"Spread: {snapshot.spread_bps} bps")
     """
+    try:
+        # Extract data array (should have one element)
+        data_array = raw_message["data"]
+        if not data_array:
+            raise ValueError("Empty data array in OKX message")
+
+        data = data_array[0]
+
+        # Extract timestamp (milliseconds string to datetime)
+        timestamp_ms = int(data["ts"])
+        timestamp = _ms_to_datetime(timestamp_ms)
+        if local_timestamp is None:
+            local_timestamp = datetime.now(timezone.utc)
 
-    # Instrument ID mapping: OKX format -> Our format
-    INSTRUMENT_MAPPING = {
-        "BTC-USDT-SWAP": "BTC-USDT-PERP",
-        "BTC-USDT": "BTC-USDT-SPOT",
-    }
+        # Extract sequence ID (seqId)
+        sequence_id = int(data["seqId"])
+
+        # Parse bids (descending) and asks (ascending), best first
+        # OKX format: [price, quantity, deprecated, num_orders]
+        bids = _parse_levels(data.get("bids", []))
+        asks = _parse_levels(data.get("asks", []))
+
+        # OKX sends data pre-sorted; only sort if that is violated
+        _ensure_sorted(bids, descending=True)
+        _ensure_sorted(asks, descending=False)
+
+        depth_levels = max(len(bids), len(asks))
+
+        snapshot = OrderBookSnapshot(
+            exchange="okx",
+            instrument=instrument,
+            timestamp=timestamp,
+            local_timestamp=local_timestamp,
+            sequence_id=sequence_id,
+            bids=bids,
+            asks=asks,
+            depth_levels=depth_levels,
+        )
+
+        logger.debug(
+            "normalized_orderbook",
+            exchange="okx",
+            instrument=instrument,
+            sequence_id=sequence_id,
+            bids_count=len(bids),
+            asks_count=len(asks),
+        )
+
+        return snapshot
+
+    except KeyError as e:
+        logger.error(
+            "orderbook_normalization_failed_missing_field",
+            exchange="okx",
+            instrument=instrument,
+            missing_field=str(e),
+            arg=raw_message.get("arg"),
+        )
+        raise ValueError(f"Missing required field in OKX message: {e}")
+    except (ValueError, TypeError, IndexError, InvalidOperation) as e:
+        logger.error(
+            "orderbook_normalization_failed_invalid_data",
+            exchange="okx",
+            instrument=instrument,
+            error=str(e),
+            arg=raw_message.get("arg"),
+        )
+        raise ValueError(f"Invalid data in OKX message: {e}")
 
-    # Reverse mapping: Our format -> OKX format
-    REVERSE_INSTRUMENT_MAPPING = {v: k for k, v in INSTRUMENT_MAPPING.items()}
 
-    @staticmethod
-    def normalize_instrument_id(okx_inst_id: str) -> str:
-        """
-        Normalize OKX instrument ID to our format.
+def normalize_orderbook_batch(
+    raw_messages: List[Dict[str, Any]],
+    instrument: str,
+) -> List[OrderBookSnapshot]:
+    """
+    Normalize several OKX order book updates received together.
+
+    All snapshots share one local receipt timestamp, read once for the
+    batch instead of once per message.
 
-        Args:
-            okx_inst_id: OKX instrument ID (e.g., "BTC-USDT-SWAP").
+    Args:
+        raw_messages: Raw OKX books channel messages, in arrival order.
+        instrument: Normalized instrument ID (e.g., "BTC-USDT-PERP").
 
-        Returns:
-            str: Normalized instrument ID (e.g., "BTC-USDT-PERP").
+    Returns:
+        List[OrderBookSnapshot]: Normalized order books, in input order.
 
-        Example:
-            >>> OKXNormalizer.normalize_instrument_id("BTC-USDT-SWAP")
-            'BTC-USDT-PERP'
-        """
-        return OKXNormalizer.INSTRUMENT_MAPPING.get(okx_inst_id, okx_inst_id)
+    Raises:
+        ValueError: If any message format is invalid.
+    """
+    local_timestamp = datetime.now(timezone.utc)
+    return [
+        normalize_orderbook(raw_message, instrument, local_timestamp)
+        for raw_message in raw_messages
+    ]
+
+
+def normalize_ticker(
+    raw_ticker: Dict[str, Any],
+    raw_mark_price: Optional[Dict[str, Any]],
+    instrument: str,
+) -> TickerSnapshot:
+    """
+    Normalize OKX ticker data to TickerSnapshot.
 
-    @staticmethod
-    def to_okx_instrument_id(normalized_id: str) -> str:
-        """
-        Convert our normalized instrument ID to OKX format.
+    Combines ticker stream and mark price stream (for perpetuals).
+    For spot, only ticker stream is used.
 
-        Args:
-            normalized_id: Our instrument ID (e.g., "BTC-USDT-PERP").
+    Args:
+        raw_ticker: Raw OKX tickers channel message data.
+        raw_mark_price: Raw OKX mark-price channel message data (perpetuals only).
+        instrument: Normalized instrument ID.
 
-        Returns:
-            str: OKX instrument ID (e.g., "BTC-USDT-SWAP").
+    Returns:
+        TickerSnapshot: Normalized ticker.
 
-        Example:
-            >>> OKXNormalizer.to_okx_instrument_id("BTC-USDT-PERP")
-            'BTC-USDT-SWAP'
-        """
-        return OKXNormalizer.REVERSE_INSTRUMENT_MAPPING.get(
-            normalized_id, normalized_id
+    Raises:
+        ValueError: If message format is invalid.
+
+    Example:
+        >>> ticker = normalize_ticker(
+        ...     raw_ticker={...},
+        ...     raw_mark_price={...},  # None for spot
+        ...     instrument="BTC-USDT-PERP"
+        ... )
+    """
+    try:
+        ts, last, high, low, vol, vol_ccy = _TICKER_FIELDS(raw_ticker)
+
+        # Extract timestamp from ticker
+        timestamp = _ms_to_datetime(int(ts))
+
+        # Core prices from ticker
+        last_price = _to_decimal(last)
+        high_24h = _to_decimal(high)
+        low_24h = _to_decimal(low)
+        volume_24h = _to_decimal(vol)
+        volume_24h_usd = _to_decimal(vol_ccy)
+
+        # Derivatives-specific data from mark price stream
+        mark_price: Optional[Decimal] = None
+        index_price: Optional[Decimal] = None
+        funding_rate: Optional[Decimal] = None
+        next_funding_time: Optional[datetime] = None
+
+        if raw_mark_price:
+            mark_px, idx_px, funding = _MARK_PRICE_FIELDS(raw_mark_price)
+            mark_price = _to_decimal(mark_px)
+            index_price = _to_decimal(idx_px)
+            funding_rate = _to_decimal(funding)
+
+            # Next funding time
+            if "nextFundingTime" in raw_mark_price:
+                next_funding_ms = int(raw_mark_price["nextFundingTime"])
+                next_funding_time = _ms_to_datetime(next_funding_ms)
+
+        ticker = TickerSnapshot(
+            exchange="okx",
+            instrument=instrument,
+            timestamp=timestamp,
+            last_price=last_price,
+            mark_price=mark_price,
+            index_price=index_price,
+            volume_24h=volume_24h,
+            volume_24h_usd=volume_24h_usd,
+            high_24h=high_24h,
+            low_24h=low_24h,
+            funding_rate=funding_rate,
+            next_funding_time=next_funding_time,
         )
 
-    @staticmethod
-    def normalize_orderbook(
-        raw_message: Dict[str, Any],
-        instrument: str,
-    ) -> OrderBookSnapshot:
-        """
-        Normalize OKX order book update to OrderBookSnapshot.
-
-        Args:
-            raw_message: Raw OKX books channel message.
-            instrument: Normalized instrument ID (e.g., "BTC-USDT-PERP").
-
-        Returns:
-            OrderBookSnapshot: Normalized order book.
-
-        Raises:
-            ValueError: If message format is invalid.
-            KeyError: If required fields are missing.
-
-        Example:
-            >>> snapshot = OKXNormalizer.normalize_orderbook(
-            ...     raw_message={
-            ...         "arg": {"channel": "books", "instId": "BTC-USDT-SWAP"},
-            ...         "data": [{
-            ...             "asks": [["50001.0", "1.5", "0", "2"]],
-            ...             "bids": [["50000.0", "2.0", "0", "3"]],
-            ...             "ts": "1234567890123",
-            ...             "seqId": 123456789
-            ...         }]
-            ...     },
-            ...     instrument="BTC-USDT-PERP"
-            ... )
-        """
-        try:
-            # Extract data array (should have one element)
-            data_array = raw_message["data"]
-            if not data_array:
-                raise ValueError("Empty data array in OKX message")
-
-            data = data_array[0]
-
-            # Extract timestamp (milliseconds string to datetime)
-            timestamp_ms = int(data["ts"])
-            timestamp = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-            local_timestamp = datetime.now(timezone.utc)
+        logger.debug(
+            "normalized_ticker",
+            exchange="okx",
+            instrument=instrument,
+            # Log the raw payload strings: same rendering as str(Decimal)
+            # without formatting a new string per message
+            last_price=last,
+            mark_price=raw_mark_price["markPx"] if raw_mark_price else None,
+        )
+
+        return ticker
+
+    except KeyError as e:
+        logger.error(
+            "ticker_normalization_failed_missing_field",
+            exchange="okx",
+            instrument=instrument,
+            missing_field=str(e),
+        )
+        raise ValueError(f"Missing required field in OKX ticker: {e}")
+    except (ValueError, TypeError, InvalidOperation) as e:
+        logger.error(
+            "ticker_normalization_failed_invalid_data",
+            exchange="okx",
+            instrument=instrument,
+            error=str(e),
+        )
+        raise ValueError(f"Invalid data in OKX ticker: {e}")
+
+
+class OKXNormalizer:
+    """
+    Normalizes OKX data to unified models.
+
+    Handles conversion from OKX-specific formats to our standardized
+    OrderBookSnapshot and TickerSnapshot models. All financial values are
+    converted to Decimal for precision.
+
+    Example:
+        >>> normalizer = OKXNormalizer()
+        >>> snapshot = normalizer.normalize_orderbook(
+        ...     raw_message=okx_books_message,
+        ...     instrument="BTC-USDT-PERP"
+        ... )
+        >>> print(f"Spread: {snapshot.spread_bps} bps")
+    """
+
+    # Instrument ID mappings (OKX format <-> our format)
+    INSTRUMENT_MAPPING = _INSTRUMENT_MAPPING
+    REVERSE_INSTRUMENT_MAPPING = _REVERSE_INSTRUMENT_MAPPING
 
-            # Extract sequence ID (seqId)
-            sequence_id = int(data["seqId"])
-
-            # Parse bids (sorted descending - best first)
-            # OKX format: [price, quantity, deprecated, num_orders]
-            bids: List[PriceLevel] = []
-            for level in data.get("bids", []):
-                price = Decimal(level[0])
-                quantity = Decimal(level[1])
-                # Skip zero quantity levels
-                if quantity > 0:
-                    bids.append(PriceLevel(price=price, quantity=quantity))
-
-            # Parse asks (sorted ascending - best first)
-            asks: List[PriceLevel] = []
-            for level in data.get("asks", []):
-                price = Decimal(level[0])
-                quantity = Decimal(level[1])
-                # Skip zero quantity levels
-                if quantity > 0:
-                    asks.append(PriceLevel(price=price, quantity=quantity))
-
-            # OKX sends data pre-sorted, but ensure it
-            bids.sort(key=lambda x: x.price, reverse=True)
-            asks.sort(key=lambda x: x.price)
-
-            depth_levels = max(len(bids), len(asks))
-
-            snapshot = OrderBookSnapshot(
-                exchange="okx",
-                instrument=instrument,
-                timestamp=timestamp,
-                local_timestamp=local_timestamp,
-                sequence_id=sequence_id,
-                bids=bids,
-                asks=asks,
-                depth_levels=depth_levels,
-            )
-
-            logger.debug(
-                "normalized_orderbook",
-                exchange="okx",
-                instrument=instrument,
-                sequence_id=sequence_id,
-                bids_count=len(bids),
-                asks_count=len(asks),
-            )
-
-            return snapshot
-
-        except KeyError as e:
-            logger.error(
-                "orderbook_normalization_failed_missing_field",
-                exchange="okx",
-                instrument=instrument,
-                missing_field=str(e),
-                message=raw_message,
-            )
-            raise ValueError(f"Missing required field in OKX message: {e}")
-        except (ValueError, TypeError, IndexError) as e:
-            logger.error(
-                "orderbook_normalization_failed_invalid_data",
-                exchange="okx",
-                instrument=instrument,
-                error=str(e),
-                message=raw_message,
-            )
-            raise ValueError(f"Invalid data in OKX message: {e}")
-
-    @staticmethod
-    def normalize_ticker(
-        raw_ticker: Dict[str, Any],
-        raw_mark_price: Optional[Dict[str, Any]],
-        instrument: str,
-    ) -> TickerSnapshot:
-        """
-        Normalize OKX ticker data to TickerSnapshot.
-
-        Combines ticker stream and mark price stream (for perpetuals).
-        For spot, only ticker stream is used.
-
-        Args:
-            raw_ticker: Raw OKX tickers channel message data.
-            raw_mark_price: Raw OKX mark-price channel message data (perpetuals only).
-            instrument: Normalized instrument ID.
-
-        Returns:
-            TickerSnapshot: Normalized ticker.
-
-        Raises:
-            ValueError: If message format is invalid.
-
-        Example:
-            >>> ticker = OKXNormalizer.normalize_ticker(
-            ...     raw_ticker={...},
-            ...     raw_mark_price={...},  # None for spot
-            ...     instrument="BTC-USDT-PERP"
-            ... )
-        """
-        try:
-            # Extract timestamp from ticker
-            timestamp_ms = int(raw_ticker["ts"])
-            timestamp = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-
-            # Core prices from ticker
-            last_price = Decimal(raw_ticker["last"])
-            high_24h = Decimal(raw_ticker["high24h"])
-            low_24h = Decimal(raw_ticker["low24h"])
-            volume_24h = Decimal(raw_ticker["vol24h"])
-            volume_24h_usd = Decimal(raw_ticker["volCcy24h"])
-
-            # Derivatives-specific data from mark price stream
-            mark_price: Optional[Decimal] = None
-            index_price: Optional[Decimal] = None
-            funding_rate: Optional[Decimal] = None
-            next_funding_time: Optional[datetime] = None
-
-            if raw_mark_price:
-                mark_price = Decimal(raw_mark_price["markPx"])
-                index_price = Decimal(raw_mark_price["idxPx"])
-                funding_rate = Decimal(raw_mark_price["fundingRate"])
-
-                # Next funding time
-                if "nextFundingTime" in raw_mark_price:
-                    next_funding_ms = int(raw_mark_price["nextFundingTime"])
-                    next_funding_time = datetime.fromtimestamp(
-                        next_funding_ms / 1000, tz=timezone.utc
-                    )
-
-            ticker = TickerSnapshot(
-                exchange="okx",
-                instrument=instrument,
-                timestamp=timestamp,
-                last_price=last_price,
-                mark_price=mark_price,
-                index_price=index_price,
-                volume_24h=volume_24h,
-                volume_24h_usd=volume_24h_usd,
-                high_24h=high_24h,
-                low_24h=low_24h,
-                funding_rate=funding_rate,
-                next_funding_time=next_funding_time,
-            )
-
-            logger.debug(
-                "normalized_ticker",
-                exchange="okx",
-                instrument=instrument,
-                last_price=str(last_price),
-                mark_price=str(mark_price) if mark_price else None,
-            )
-
-            return ticker
-
-        except KeyError as e:
-            logger.error(
-                "ticker_normalization_failed_missing_field",
-                exchange="okx",
-                instrument=instrument,
-                missing_field=str(e),
-            )
-            raise ValueError(f"Missing required field in OKX ticker: {e}")
-        except (ValueError, TypeError) as e:
-            logger.error(
-                "ticker_normalization_failed_invalid_data",
-                exchange="okx",
-                instrument=instrument,
-                error=str(e),
-            )
-            raise ValueError(f"Invalid data in OKX ticker: {e}")
+    # Module-level functions re-exported as static methods for existing callers
+    normalize_instrument_id = staticmethod(normalize_instrument_id)
+    to_okx_instrument_id = staticmethod(to_okx_instrument_id)
+    normalize_orderbook = staticmethod(normalize_orderbook)
+    normalize_orderbook_batch = staticmethod(normalize_orderbook_batch)
+    normalize_ticker = staticmethod(normalize_ticker)
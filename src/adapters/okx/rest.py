@@ -9,10 +9,11 @@ Endpoints:
     Order Book: GET /api/v5/market/books?instId={instId}&sz=20
     Ticker: GET /api/v5/market/ticker?instId={instId}
     Mark Price: GET /api/v5/public/mark-price?instType=SWAP&instId={instId}
+    Funding Rate: GET /api/v5/public/funding-rate?instId={instId}
 
 Rate Limits:
     - OKX: 20 requests per 2 seconds (10 per second)
-    - Conservative default: 10 per second with token bucket
+    - Default: token bucket refilling 10 per second, bursts of up to 20
 
 Response Format (Order Book):
     {
@@ -47,19 +48,34 @@ Response Format (Ticker):
 """
 
 import asyncio
+import time
 from datetime import datetime, timezone
-from decimal import Decimal
-from typing import Any, Dict, Optional
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Optional, Tuple, Union
 
 import aiohttp
+import orjson
 import structlog
 
-from src.adapters.okx.normalizer import OKXNormalizer
-from src.models.orderbook import OrderBookSnapshot, PriceLevel
+from src.adapters.okx.normalizer import (
+    _TICKER_FIELDS,
+    _ensure_sorted,
+    _ms_to_datetime,
+    _parse_levels,
+    _to_decimal,
+)
+from src.models.orderbook import OrderBookSnapshot
 from src.models.ticker import TickerSnapshot
 
 logger = structlog.get_logger(__name__)
 
+# HTTP sessions shared by every client of the same base URL on the same event
+# loop, so all of them reuse one connection pool (and its warm TLS
+# connections). Reference-counted; the last client to close() closes it.
+_SessionKey = Tuple[str, asyncio.AbstractEventLoop]
+_SESSIONS: Dict[_SessionKey, aiohttp.ClientSession] = {}
+_SESSION_REFS: Dict[_SessionKey, int] = {}
+
 
 class RateLimitError(Exception):
     """Raised when rate limit is exceeded."""
@@ -107,8 +123,16 @@ class OKXRestClient:
         self.timeout_seconds = timeout_seconds
 
         self._session: Optional[aiohttp.ClientSession] = None
-        self._last_request_time: float = 0.0
-        self._request_interval = 1.0 / rate_limit_per_second
+        self._session_key: Optional[_SessionKey] = None
+        # Per-request timeout, since the session is shared between clients
+        self._timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        # Token bucket: OKX allows bursts of 20 requests per 2 seconds, so
+        # the bucket holds two seconds' worth of tokens
+        self._capacity = float(rate_limit_per_second * 2)
+        self._tokens = self._capacity
+        self._refill_rate = float(rate_limit_per_second)
+        self._last_refill: Optional[float] = None
+        self._rate_lock = asyncio.Lock()
 
         logger.info(
             "rest_client_initialized",
@@ -118,35 +142,84 @@ class OKXRestClient:
         )
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Ensure aiohttp session is created."""
+        """
+        Ensure this client holds the shared session for its base URL.
+
+        No lock is needed: nothing between the registry lookup and the
+        insert awaits, so concurrent callers on one loop cannot interleave.
+        """
         if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.timeout_seconds)
-            self._session = aiohttp.ClientSession(
-                timeout=timeout,
-                headers={"User-Agent": "crypto-surveillance/1.0"},
-            )
+            key = (self.base_url, asyncio.get_running_loop())
+            session = _SESSIONS.get(key)
+            if session is None or session.closed:
+                session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=100,
+                        limit_per_host=20,
+                        ttl_dns_cache=600,
+                        keepalive_timeout=75,
+                        enable_cleanup_closed=True,
+                    ),
+                    headers={"User-Agent": "crypto-surveillance/1.0"},
+                )
+                _SESSIONS[key] = session
+
+            if self._session_key is None:
+                self._session_key = key
+                _SESSION_REFS[key] = _SESSION_REFS.get(key, 0) + 1
+
+            self._session = session
         return self._session
 
     async def close(self) -> None:
-        """Close the HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """
+        Release this client's hold on the shared HTTP session.
+
+        The session is closed once the last client using it is closed.
+        Safe to call multiple times.
+        """
+        key = self._session_key
+        self._session = None
+        self._session_key = None
+        if key is None:
+            return
+
+        refs = _SESSION_REFS.get(key, 1) - 1
+        if refs > 0:
+            _SESSION_REFS[key] = refs
+            return
+
+        _SESSION_REFS.pop(key, None)
+        session = _SESSIONS.pop(key, None)
+        if session is not None and not session.closed:
+            await session.close()
             logger.debug("rest_client_session_closed", exchange="okx", base_url=self.base_url)
 
     async def _rate_limit(self) -> None:
         """
-        Apply rate limiting using simple time-based throttling.
+        Apply rate limiting using a token bucket.
 
-        Ensures minimum interval between requests.
+        Up to ``2 * rate_limit_per_second`` requests may proceed at once;
+        beyond that, callers wait for tokens that refill at
+        ``rate_limit_per_second``. Waiters queue on a lock and are released
+        in order.
         """
-        current_time = asyncio.get_event_loop().time()
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < self._request_interval:
-            wait_time = self._request_interval - time_since_last
-            await asyncio.sleep(wait_time)
-
-        self._last_request_time = asyncio.get_event_loop().time()
+        async with self._rate_lock:
+            now = time.monotonic()
+            if self._last_refill is not None:
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._last_refill) * self._refill_rate,
+                )
+            self._last_refill = now
+
+            if self._tokens < 1.0:
+                await asyncio.sleep((1.0 - self._tokens) / self._refill_rate)
+                now = time.monotonic()
+                self._tokens += (now - self._last_refill) * self._refill_rate
+                self._last_refill = now
+
+            self._tokens -= 1.0
 
     async def _request(
         self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None
@@ -173,7 +246,9 @@ class OKXRestClient:
         url = f"{self.base_url}{endpoint}"
 
         try:
-            async with session.request(method, url, params=params) as response:
+            async with session.request(
+                method, url, params=params, timeout=self._timeout
+            ) as response:
                 # Check for rate limiting
                 if response.status == 429:
                     retry_after = int(response.headers.get("Retry-After", 60))
@@ -199,7 +274,9 @@ class OKXRestClient:
                         f"REST request failed with status {response.status}: {error_text}"
                     )
 
-                data = await response.json()
+                # Parse the raw body directly; skips aiohttp's content-type
+                # and charset handling in favour of orjson's native parser
+                data = orjson.loads(await response.read())
 
                 # Check OKX-specific error code
                 if data.get("code") != "0":
@@ -263,26 +340,16 @@ class OKXRestClient:
 
             # Parse response
             timestamp_ms = int(data["ts"])
-            timestamp = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
+            timestamp = _ms_to_datetime(timestamp_ms)
             sequence_id = int(data["seqId"])
 
-            # Parse bids (OKX format: [price, quantity, deprecated, num_orders])
-            bids = [
-                PriceLevel(price=Decimal(level[0]), quantity=Decimal(level[1]))
-                for level in data.get("bids", [])
-                if Decimal(level[1]) > 0
-            ]
+            # Parse bids and asks (OKX format: [price, quantity, deprecated, num_orders])
+            bids = _parse_levels(data.get("bids", []))
+            asks = _parse_levels(data.get("asks", []))
 
-            # Parse asks
-            asks = [
-                PriceLevel(price=Decimal(level[0]), quantity=Decimal(level[1]))
-                for level in data.get("asks", [])
-                if Decimal(level[1]) > 0
-            ]
-
-            # Ensure sorted
-            bids.sort(key=lambda x: x.price, reverse=True)
-            asks.sort(key=lambda x: x.price)
+            # OKX sends data pre-sorted; optionally repair violations
+            _ensure_sorted(bids, descending=True)
+            _ensure_sorted(asks, descending=False)
 
             snapshot = OrderBookSnapshot(
                 exchange="okx",
@@ -316,11 +383,21 @@ class OKXRestClient:
                 missing_field=str(e),
             )
             raise ValueError(f"Invalid order book response: missing {e}")
+        except InvalidOperation as e:
+            logger.error(
+                "rest_orderbook_parse_error",
+                exchange="okx",
+                instrument=instrument,
+                inst_id=inst_id,
+                error=str(e),
+            )
+            raise ValueError(f"Invalid order book response: {e}")
 
     async def get_ticker(
         self,
         inst_id: str,
         instrument: str = "UNKNOWN",
+        is_perpetual: Optional[bool] = None,
     ) -> TickerSnapshot:
         """
         Fetch ticker snapshot via REST API.
@@ -328,6 +405,9 @@ class OKXRestClient:
         Args:
             inst_id: OKX instrument ID (e.g., "BTC-USDT-SWAP").
             instrument: Normalized instrument ID.
+            is_perpetual: Whether to also fetch mark price and funding rate.
+                Callers that know the instrument type should pass it; when
+                omitted it is inferred from the "-SWAP" suffix.
 
         Returns:
             TickerSnapshot: Current ticker state.
@@ -352,13 +432,13 @@ class OKXRestClient:
 
             ticker_data = ticker_data_array[0]
 
-            timestamp_ms = int(ticker_data["ts"])
-            timestamp = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-            last_price = Decimal(ticker_data["last"])
-            high_24h = Decimal(ticker_data["high24h"])
-            low_24h = Decimal(ticker_data["low24h"])
-            volume_24h = Decimal(ticker_data["vol24h"])
-            volume_24h_usd = Decimal(ticker_data["volCcy24h"])
+            ts, last, high, low, vol, vol_ccy = _TICKER_FIELDS(ticker_data)
+            timestamp = _ms_to_datetime(int(ts))
+            last_price = _to_decimal(last)
+            high_24h = _to_decimal(high)
+            low_24h = _to_decimal(low)
+            volume_24h = _to_decimal(vol)
+            volume_24h_usd = _to_decimal(vol_ccy)
 
             # Fetch mark price for perpetuals (SWAP instruments)
             mark_price: Optional[Decimal] = None
@@ -366,35 +446,35 @@ class OKXRestClient:
             funding_rate: Optional[Decimal] = None
             next_funding_time: Optional[datetime] = None
 
-            if inst_id.endswith("-SWAP"):
+            if is_perpetual is None:
+                is_perpetual = inst_id.endswith("-SWAP")
+
+            if is_perpetual:
+                # Mark price and funding rate are independent; fetch concurrently.
+                # With return_exceptions, a failed request yields its exception.
+                mark_response: Union[Dict[str, Any], BaseException]
+                funding_response: Union[Dict[str, Any], BaseException]
+                mark_response, funding_response = await asyncio.gather(
+                    self._request(
+                        "GET",
+                        "/api/v5/public/mark-price",
+                        {"instType": "SWAP", "instId": inst_id},
+                    ),
+                    self._request(
+                        "GET", "/api/v5/public/funding-rate", {"instId": inst_id}
+                    ),
+                    return_exceptions=True,
+                )
+
                 try:
-                    mark_endpoint = "/api/v5/public/mark-price"
-                    mark_params = {"instType": "SWAP", "instId": inst_id}
-                    mark_response = await self._request("GET", mark_endpoint, mark_params)
+                    if isinstance(mark_response, BaseException):
+                        raise mark_response
 
                     mark_data_array = mark_response.get("data", [])
                     if mark_data_array:
                         mark_data = mark_data_array[0]
-                        mark_price = Decimal(mark_data["markPx"])
-                        index_price = Decimal(mark_data.get("idxPx", "0"))
-
-                        # Fetch funding rate
-                        funding_endpoint = "/api/v5/public/funding-rate"
-                        funding_params = {"instId": inst_id}
-                        funding_response = await self._request(
-                            "GET", funding_endpoint, funding_params
-                        )
-
-                        funding_data_array = funding_response.get("data", [])
-                        if funding_data_array:
-                            funding_data = funding_data_array[0]
-                            funding_rate = Decimal(funding_data["fundingRate"])
-
-                            if "nextFundingTime" in funding_data:
-                                next_funding_ms = int(funding_data["nextFundingTime"])
-                                next_funding_time = datetime.fromtimestamp(
-                                    next_funding_ms / 1000, tz=timezone.utc
-                                )
+                        mark_price = _to_decimal(mark_data["markPx"])
+                        index_price = _to_decimal(mark_data.get("idxPx", "0"))
 
                 except Exception as e:
                     logger.warning(
@@ -404,6 +484,27 @@ class OKXRestClient:
                         error=str(e),
                     )
 
+                try:
+                    if isinstance(funding_response, BaseException):
+                        raise funding_response
+
+                    funding_data_array = funding_response.get("data", [])
+                    if funding_data_array:
+                        funding_data = funding_data_array[0]
+                        funding_rate = _to_decimal(funding_data["fundingRate"])
+
+                        if "nextFundingTime" in funding_data:
+                            next_funding_ms = int(funding_data["nextFundingTime"])
+                            next_funding_time = _ms_to_datetime(next_funding_ms)
+
+                except Exception as e:
+                    logger.warning(
+                        "rest_funding_rate_fetch_failed",
+                        exchange="okx",
+                        instrument=instrument,
+                        error=str(e),
+                    )
+
             ticker = TickerSnapshot(
                 exchange="okx",
                 instrument=instrument,
@@ -424,7 +525,7 @@ class OKXRestClient:
                 exchange="okx",
                 instrument=instrument,
                 inst_id=inst_id,
-                last_price=str(last_price),
+                last_price=last,
             )
 
             return ticker
@@ -7,14 +7,15 @@ streaming message delivery.
 
 Connection Management:
     - Auto-reconnect with exponential backoff and jitter
-    - String-based ping/pong heartbeat every 30 seconds
+    - Protocol-level keepalive (websockets library ping/pong frames)
+    - String "ping" only after ``ping_interval`` seconds without messages
     - Connection state tracking
     - Graceful disconnect handling
 
 OKX-Specific Details:
     - Single WebSocket endpoint for all instruments
     - Subscription via JSON messages: {"op": "subscribe", "args": [...]}
-    - Ping format: string "ping" (not binary frame)
+    - Idle ping format: string "ping" (in addition to protocol pings)
     - Pong response: string "pong"
 
 Example:
@@ -33,17 +34,33 @@ Example:
 """
 
 import asyncio
-import json
 import random
-from datetime import datetime, timezone
-from typing import Any, AsyncIterator, Dict, List, Optional
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
 
+import orjson
 import structlog
 import websockets
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
 logger = structlog.get_logger(__name__)
 
+# OKX's reply to a text "ping", as a text or binary frame
+_PONG_FRAMES = ("pong", b"pong")
+
+# Returned by a receive step once the stream should stop
+_STREAM_END = object()
+
+# Upper bound in seconds for the reconnect backoff delay
+_MAX_RECONNECT_DELAY = 60.0
+
+# Seconds to wait for the closing handshake before aborting the transport
+_CLOSE_TIMEOUT = 2.0
+
+# Minimum seconds between warnings about messages dropped from full queues
+_DROP_LOG_INTERVAL = 10.0
+
 
 class OKXWebSocketClient:
     """
@@ -72,6 +89,34 @@ class OKXWebSocketClient:
         ...     print(message)
     """
 
+    __slots__ = (
+        "_backoff_table",
+        "_channel_queues",
+        "_connect_mono_ns",
+        "_connect_wallclock",
+        "_connected",
+        "_drop_log_mono",
+        "_dropped_count",
+        "_drops_since_log",
+        "_last_message_ns",
+        "_log",
+        "_ping_handle",
+        "_ping_send_task",
+        "_reconnect_count",
+        "_router_task",
+        "_should_reconnect",
+        "_stream_error",
+        "_subscription_payloads",
+        "_subscriptions",
+        "_ws",
+        "max_reconnect_attempts",
+        "ping_interval",
+        "ping_timeout",
+        "reconnect_delay",
+        "subscribe_batch_size",
+        "url",
+    )
+
     def __init__(
         self,
         url: str,
@@ -79,6 +124,7 @@ class OKXWebSocketClient:
         ping_timeout: int = 10,
         max_reconnect_attempts: int = 10,
         reconnect_delay: int = 5,
+        subscribe_batch_size: int = 100,
     ):
         """
         Initialize WebSocket client.
@@ -89,25 +135,50 @@ class OKXWebSocketClient:
             ping_timeout: Seconds to wait for pong response.
             max_reconnect_attempts: Maximum reconnection attempts.
             reconnect_delay: Base delay in seconds for reconnection backoff.
+            subscribe_batch_size: Maximum channels per subscription message.
         """
         self.url = url
+        self._log = logger.bind(exchange="okx", url=url)
         self.ping_interval = ping_interval
         self.ping_timeout = ping_timeout
         self.max_reconnect_attempts = max_reconnect_attempts
         self.reconnect_delay = reconnect_delay
+        self.subscribe_batch_size = subscribe_batch_size
+        # Backoff delay per attempt, capped at 60s; the jitter is added on use
+        self._backoff_table = [
+            min(reconnect_delay * (1 << i), _MAX_RECONNECT_DELAY)
+            for i in range(max_reconnect_attempts + 1)
+        ]
 
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
         self._subscriptions: List[Dict[str, Any]] = []
+        # Serialized subscribe frames, kept for re-subscribing on reconnect
+        self._subscription_payloads: List[str] = []
         self._connected = False
         self._reconnect_count = 0
-        self._last_message_at: Optional[datetime] = None
-        self._ping_task: Optional[asyncio.Task] = None
+        # Receive times are kept as monotonic ns (cheap int per message) and
+        # mapped to wall-clock time on read via the connect-time anchor
+        self._last_message_ns = 0
+        self._connect_mono_ns = 0
+        self._connect_wallclock: Optional[datetime] = None
+        # Idle heartbeat: a timer (not a sleeping task) that sends OKX's
+        # string "ping" only when no message arrived for ping_interval
+        self._ping_handle: Optional[asyncio.TimerHandle] = None
+        self._ping_send_task: Optional[asyncio.Task[None]] = None
         self._should_reconnect = True
 
-        logger.info(
+        # Per-channel fan-out: one reader task routes each message to the
+        # queues registered for its channel
+        self._channel_queues: Dict[str, Set[asyncio.Queue[Optional[Dict[str, Any]]]]] = {}
+        self._router_task: Optional[asyncio.Task[None]] = None
+        self._dropped_count = 0
+        self._drops_since_log = 0
+        self._drop_log_mono = 0.0
+        # Error that stopped the router, re-raised to queue consumers
+        self._stream_error: Optional[BaseException] = None
+
+        self._log.info(
             "websocket_client_initialized",
-            exchange="okx",
-            url=url,
             ping_interval=ping_interval,
             max_attempts=max_reconnect_attempts,
         )
@@ -125,84 +196,149 @@ class OKXWebSocketClient:
     @property
     def last_message_at(self) -> Optional[datetime]:
         """Get timestamp of last received message."""
-        return self._last_message_at
+        if not self._last_message_ns or self._connect_wallclock is None:
+            return None
+        return self._connect_wallclock + timedelta(
+            microseconds=(self._last_message_ns - self._connect_mono_ns) // 1000
+        )
+
+    @property
+    def dropped_count(self) -> int:
+        """Get the number of messages dropped from full channel queues."""
+        return self._dropped_count
+
+    @property
+    def stream_error(self) -> Optional[BaseException]:
+        """Get the error that stopped the channel router, if any."""
+        return self._stream_error
 
     async def connect(self) -> None:
         """
         Establish WebSocket connection.
 
-        Opens the WebSocket connection and starts the ping task.
+        Opens the WebSocket connection. Protocol-level heartbeats are handled
+        by the websockets library keepalive; the idle "ping" timer is armed
+        as a fallback for OKX's text heartbeat.
         Idempotent - does nothing if already connected.
 
         Raises:
             ConnectionError: If connection fails after max retries.
         """
         if self.is_connected:
-            logger.debug("websocket_already_connected", exchange="okx", url=self.url)
+            self._log.debug("websocket_already_connected")
             return
 
         try:
             self._ws = await websockets.connect(
                 self.url,
-                ping_interval=None,  # We handle pings manually
-                ping_timeout=None,
+                ping_interval=self.ping_interval,
+                ping_timeout=self.ping_timeout,
                 close_timeout=10,
                 max_size=2**20,  # 1MB max message size
+                read_limit=2**18,  # Buffer a full snapshot frame per read
             )
             self._connected = True
+            self._connect_wallclock = datetime.now(timezone.utc)
+            self._connect_mono_ns = time.monotonic_ns()
 
-            # Start ping task
-            self._ping_task = asyncio.create_task(self._send_pings())
+            # Arm the idle "ping" timer
+            self._schedule_ping(self.ping_interval)
 
-            logger.info(
+            self._log.info(
                 "websocket_connected",
-                exchange="okx",
-                url=self.url,
                 reconnect_count=self._reconnect_count,
             )
 
         except Exception as e:
-            logger.error(
-                "websocket_connection_failed", exchange="okx", url=self.url, error=str(e)
-            )
+            self._log.error("websocket_connection_failed", error=str(e))
             raise ConnectionError(f"Failed to connect to OKX WebSocket: {e}")
 
     async def disconnect(self) -> None:
         """
         Gracefully close WebSocket connection.
 
-        Cancels ping task, closes connection, and cleans up resources.
-        Safe to call multiple times.
+        Cancels the idle ping timer, closes connection, and cleans up
+        resources. The closing handshake is bounded by a short timeout,
+        after which the transport is aborted, so an unresponsive peer
+        cannot stall shutdown. Safe to call multiple times.
         """
         self._should_reconnect = False
-
-        # Cancel ping task
-        if self._ping_task and not self._ping_task.done():
-            self._ping_task.cancel()
-            try:
-                await self._ping_task
-            except asyncio.CancelledError:
-                pass
+        self._cancel_ping()
 
         # Close WebSocket
         if self._ws:
             try:
-                await self._ws.close()
-                logger.info("websocket_disconnected", exchange="okx", url=self.url)
+                await asyncio.wait_for(self._ws.close(), timeout=_CLOSE_TIMEOUT)
+                self._log.info("websocket_disconnected")
+            except asyncio.TimeoutError:
+                self._log.warning("websocket_close_timeout", timeout=_CLOSE_TIMEOUT)
+                self._ws.transport.abort()
             except Exception as e:
-                logger.warning(
-                    "websocket_close_error", exchange="okx", url=self.url, error=str(e)
-                )
+                self._log.warning("websocket_close_error", error=str(e))
 
         self._connected = False
         self._ws = None
 
+        # Stop the channel router; its cleanup wakes up queue consumers
+        if self._router_task and not self._router_task.done():
+            self._router_task.cancel()
+            try:
+                await self._router_task
+            except asyncio.CancelledError:
+                pass
+
+    def subscribe_channel(
+        self, *channels: str, maxsize: int = 1000
+    ) -> asyncio.Queue[Optional[Dict[str, Any]]]:
+        """
+        Register a queue receiving only the messages of the given channels.
+
+        Lets several consumers share the connection: a single router task
+        reads the socket and fans each data message out to the queues
+        registered for its ``arg.channel``. When a queue is full the oldest
+        message is dropped, since only the latest market data matters.
+        ``None`` is put on the queue once the stream ends; if it ended with
+        an error, that error is available from ``stream_error``.
+
+        Args:
+            *channels: Channel names (e.g., "books5", "tickers").
+            maxsize: Maximum number of buffered messages.
+
+        Returns:
+            asyncio.Queue: Queue of parsed messages for the channels.
+
+        Example:
+            >>> queue = client.subscribe_channel("books5")
+            >>> while (message := await queue.get()) is not None:
+            ...     print(message)
+        """
+        queue: asyncio.Queue[Optional[Dict[str, Any]]] = asyncio.Queue(maxsize=maxsize)
+        for channel in channels:
+            self._channel_queues.setdefault(channel, set()).add(queue)
+
+        if self._router_task is None or self._router_task.done():
+            self._stream_error = None
+            self._router_task = asyncio.create_task(self._route_messages())
+
+        return queue
+
+    def unsubscribe_channel(self, queue: asyncio.Queue[Optional[Dict[str, Any]]]) -> None:
+        """
+        Unregister a queue returned by ``subscribe_channel()``.
+
+        Args:
+            queue: Queue to stop delivering messages to.
+        """
+        for queues in self._channel_queues.values():
+            queues.discard(queue)
+
     async def subscribe(self, channels: List[Dict[str, Any]]) -> None:
         """
         Subscribe to data channels.
 
         OKX uses JSON subscription messages with format:
         {"op": "subscribe", "args": [{"channel": "books", "instId": "BTC-USDT-SWAP"}]}
+        Channels are sent in messages of at most ``subscribe_batch_size`` args.
 
         Args:
             channels: List of channel subscription objects.
@@ -223,32 +359,73 @@ class OKXWebSocketClient:
 
         self._subscriptions = channels
 
-        # Build subscription message
-        subscription_msg = {"op": "subscribe", "args": channels}
+        # One subscription message per batch keeps each frame bounded.
+        # Decoded to str so it goes out as a text frame, which OKX expects
+        # for requests; bytes would be sent as binary.
+        batch_size = self.subscribe_batch_size
+        self._subscription_payloads = [
+            orjson.dumps(
+                {"op": "subscribe", "args": channels[start : start + batch_size]}
+            ).decode()
+            for start in range(0, len(channels), batch_size)
+        ]
 
         try:
-            await self._ws.send(json.dumps(subscription_msg))
-            logger.info(
+            await self._send_subscriptions()
+
+            self._log.info(
                 "websocket_subscribed",
-                exchange="okx",
-                url=self.url,
-                channels=channels,
+                channels=len(channels),
+                batch_size=batch_size,
             )
         except Exception as e:
-            logger.error(
+            self._log.error(
                 "websocket_subscription_failed",
-                exchange="okx",
-                url=self.url,
                 error=str(e),
             )
             raise RuntimeError(f"Failed to subscribe: {e}")
 
+    async def _send_subscriptions(self) -> None:
+        """Send the serialized subscribe frames built by ``subscribe()``."""
+        for payload in self._subscription_payloads:
+            await self._ws.send(payload)
+
+    async def run(self, on_message: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+        """
+        Receive messages and pass each data message to a handler.
+
+        Push-based counterpart of ``stream_messages()``: the handler is
+        awaited directly from the receive loop, without an async generator
+        in between. Automatically handles reconnection on connection loss
+        and returns once the client is disconnected.
+
+        Args:
+            on_message: Coroutine function called with each parsed data message.
+
+        Raises:
+            ConnectionError: If connection fails and cannot be recovered.
+
+        Example:
+            >>> async def handle(message):
+            ...     print(message["arg"]["channel"])
+            >>> await client.run(handle)
+        """
+        receive = self._receive_message
+        while self._should_reconnect:
+            message = await receive()
+            if message is None:
+                continue
+            if message is _STREAM_END:
+                break
+            await on_message(message)
+
     async def stream_messages(self) -> AsyncIterator[Dict[str, Any]]:
         """
         Stream messages from WebSocket.
 
         Yields parsed JSON messages as they arrive. Automatically handles
-        reconnection on connection loss.
+        reconnection on connection loss. ``run()`` delivers the same
+        messages to a callback without the async generator.
 
         Yields:
             Dict[str, Any]: Parsed JSON message.
@@ -261,90 +438,171 @@ class OKXWebSocketClient:
             ...     if message.get("arg", {}).get("channel") == "books":
             ...         print(f"Order book update: {message}")
         """
+        receive = self._receive_message
         while self._should_reconnect:
+            message = await receive()
+            if message is None:
+                continue
+            if message is _STREAM_END:
+                break
+            yield message
+
+    async def _receive_message(self) -> Any:
+        """
+        Perform one receive step, reconnecting first if needed.
+
+        Returns:
+            The parsed data message; None if the frame carried no data
+            (heartbeat, control event, bad JSON, recovered error); or
+            ``_STREAM_END`` once the stream should stop.
+
+        Raises:
+            ConnectionError: If max reconnection attempts exceeded.
+        """
+        if not self.is_connected:
+            # Outside the try below: the ConnectionError raised once the
+            # reconnect attempts are exhausted must reach the caller
+            try:
+                await self._reconnect()
+            except asyncio.CancelledError:
+                self._log.info("websocket_stream_cancelled")
+                return _STREAM_END
+
+        try:
+            if not self._ws:
+                await asyncio.sleep(1)
+                return None
+
+            # Receive message. websockets 12 has no option to skip UTF-8
+            # decoding of text frames; orjson accepts str and bytes alike.
+            raw_message = await self._ws.recv()
+            self._last_message_ns = time.monotonic_ns()
+
+            # Heartbeat replies are bare text, not JSON: skip the parser
+            if raw_message in _PONG_FRAMES:
+                self._log.debug("websocket_pong_received")
+                return None
+
+            # Parse JSON
             try:
-                if not self.is_connected:
-                    await self._reconnect()
-
-                if not self._ws:
-                    await asyncio.sleep(1)
-                    continue
-
-                # Receive message
-                raw_message = await self._ws.recv()
-                self._last_message_at = datetime.now(timezone.utc)
-
-                # Parse JSON
-                try:
-                    message = json.loads(raw_message)
-
-                    # Handle pong responses
-                    if message == "pong":
-                        logger.debug("websocket_pong_received", exchange="okx")
-                        continue
-
-                    # Handle subscription confirmations
-                    if message.get("event") == "subscribe":
-                        logger.info(
-                            "websocket_subscription_confirmed",
-                            exchange="okx",
-                            channel=message.get("arg"),
-                        )
-                        continue
-
-                    # Handle errors
-                    if message.get("event") == "error":
-                        logger.error(
-                            "websocket_error_message",
-                            exchange="okx",
-                            error=message.get("msg"),
-                            code=message.get("code"),
-                        )
-                        continue
-
-                    # Yield data messages
-                    if "data" in message:
-                        yield message
-
-                except json.JSONDecodeError as e:
-                    logger.warning(
-                        "websocket_invalid_json",
-                        exchange="okx",
-                        url=self.url,
-                        error=str(e),
+                message = orjson.loads(raw_message)
+            except orjson.JSONDecodeError as e:
+                self._log.warning(
+                    "websocket_invalid_json",
+                    error=str(e),
+                    message=raw_message[:100],
+                )
+                return None
+
+            # Only JSON objects carry data or events; the one other frame OKX
+            # sends is a JSON-quoted pong (bare "pong" frames are skipped above)
+            if type(message) is not dict:
+                if message == "pong":
+                    self._log.debug("websocket_pong_received")
+                else:
+                    self._log.warning(
+                        "websocket_unexpected_frame",
                         message=raw_message[:100],
                     )
-                    continue
+                return None
 
-            except ConnectionClosed:
-                logger.warning("websocket_connection_closed", exchange="okx", url=self.url)
-                self._connected = False
-                if self._should_reconnect:
-                    await self._reconnect()
-                else:
-                    break
+            # Data pushes are the common case and carry "data"; control
+            # frames carry "event" instead, so probe "data" first
+            if "data" in message:
+                return message
 
-            except WebSocketException as e:
-                logger.error("websocket_error", exchange="okx", url=self.url, error=str(e))
-                self._connected = False
-                if self._should_reconnect:
-                    await self._reconnect()
-                else:
-                    break
+            event = message.get("event")
 
-            except asyncio.CancelledError:
-                logger.info("websocket_stream_cancelled", exchange="okx", url=self.url)
-                break
+            # Handle subscription confirmations
+            if event == "subscribe":
+                self._log.info(
+                    "websocket_subscription_confirmed",
+                    channel=message.get("arg"),
+                )
 
-            except Exception as e:
-                logger.error(
-                    "websocket_unexpected_error",
-                    exchange="okx",
-                    url=self.url,
-                    error=str(e),
-                    error_type=type(e).__name__,
+            # Handle errors
+            elif event == "error":
+                self._log.error(
+                    "websocket_error_message",
+                    error=message.get("msg"),
+                    code=message.get("code"),
                 )
-                await asyncio.sleep(1)
+
+        except ConnectionClosed:
+            self._log.warning("websocket_connection_closed")
+            self._connected = False
+            if self._should_reconnect:
+                await self._reconnect()
+            else:
+                return _STREAM_END
+
+        except WebSocketException as e:
+            self._log.error("websocket_error", error=str(e))
+            self._connected = False
+            if self._should_reconnect:
+                await self._reconnect()
+            else:
+                return _STREAM_END
+
+        except asyncio.CancelledError:
+            self._log.info("websocket_stream_cancelled")
+            return _STREAM_END
+
+        except Exception as e:
+            self._log.error(
+                "websocket_unexpected_error",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            await asyncio.sleep(1)
+
+        return None
+
+    async def _route_messages(self) -> None:
+        """
+        Fan messages out to the per-channel queues.
+
+        Runs as a single task per client so the socket is read once no
+        matter how many consumers there are.
+        """
+        channel_queues = self._channel_queues
+        put_latest = self._put_latest
+
+        async def dispatch(message: Dict[str, Any]) -> None:
+            arg = message.get("arg")
+            if arg:
+                for queue in channel_queues.get(arg.get("channel"), ()):
+                    put_latest(queue, message)
+
+        try:
+            await self.run(dispatch)
+        except Exception as e:
+            # Kept for the consumers instead of dying with the task
+            self._stream_error = e
+        finally:
+            # Signal end of stream to every consumer
+            for queue in {q for queues in self._channel_queues.values() for q in queues}:
+                self._put_latest(queue, None)
+
+    def _put_latest(
+        self, queue: asyncio.Queue[Optional[Dict[str, Any]]], item: Optional[Dict[str, Any]]
+    ) -> None:
+        """Put an item on a queue, dropping the oldest item if it is full."""
+        if queue.full():
+            queue.get_nowait()
+            self._dropped_count += 1
+            self._drops_since_log += 1
+            now = time.monotonic()
+            if now - self._drop_log_mono >= _DROP_LOG_INTERVAL:
+                self._log.warning(
+                    "websocket_queue_overflow",
+                    dropped=self._drops_since_log,
+                    dropped_total=self._dropped_count,
+                    maxsize=queue.maxsize,
+                )
+                self._drops_since_log = 0
+                self._drop_log_mono = now
+        queue.put_nowait(item)
 
     async def _reconnect(self) -> None:
         """
@@ -357,10 +615,8 @@ class OKXWebSocketClient:
             ConnectionError: If max reconnection attempts exceeded.
         """
         if self._reconnect_count >= self.max_reconnect_attempts:
-            logger.error(
+            self._log.error(
                 "websocket_max_reconnect_exceeded",
-                exchange="okx",
-                url=self.url,
                 max_attempts=self.max_reconnect_attempts,
             )
             raise ConnectionError(
@@ -368,18 +624,12 @@ class OKXWebSocketClient:
             )
 
         # Exponential backoff with jitter
-        base_delay = self.reconnect_delay
-        max_delay = 60.0
         attempt = self._reconnect_count
+        delay = self._backoff_table[attempt]
+        total_delay = delay + random.random() * delay * 0.1
 
-        delay = min(base_delay * (2**attempt), max_delay)
-        jitter = random.uniform(0, delay * 0.1)
-        total_delay = delay + jitter
-
-        logger.info(
+        self._log.info(
             "websocket_reconnecting",
-            exchange="okx",
-            url=self.url,
             attempt=attempt + 1,
             max_attempts=self.max_reconnect_attempts,
             delay_seconds=total_delay,
@@ -391,60 +641,78 @@ class OKXWebSocketClient:
             await self.connect()
             self._reconnect_count += 1
 
-            # Re-subscribe to channels
-            if self._subscriptions:
-                await self.subscribe(self._subscriptions)
+            # Re-subscribe to channels by resending the cached frames
+            if self._subscription_payloads:
+                await self._send_subscriptions()
 
-            logger.info(
+            self._log.info(
                 "websocket_reconnected",
-                exchange="okx",
-                url=self.url,
                 reconnect_count=self._reconnect_count,
             )
 
         except Exception as e:
-            logger.error(
+            self._log.error(
                 "websocket_reconnect_failed",
-                exchange="okx",
-                url=self.url,
                 attempt=attempt + 1,
                 error=str(e),
             )
             self._reconnect_count += 1
             # Will retry on next iteration
 
-    async def _send_pings(self) -> None:
+    def _schedule_ping(self, delay: float) -> None:
+        """Arm the idle ping timer to fire after ``delay`` seconds."""
+        if self._ping_handle is not None:
+            self._ping_handle.cancel()
+        self._ping_handle = asyncio.get_running_loop().call_later(
+            delay, self._on_ping_timer
+        )
+
+    def _cancel_ping(self) -> None:
+        """Cancel the idle ping timer and any in-flight ping send."""
+        if self._ping_handle is not None:
+            self._ping_handle.cancel()
+            self._ping_handle = None
+        if self._ping_send_task is not None and not self._ping_send_task.done():
+            self._ping_send_task.cancel()
+        self._ping_send_task = None
+
+    def _on_ping_timer(self) -> None:
         """
-        Send periodic ping messages.
+        Send a string "ping" if the connection has been idle long enough.
 
-        OKX expects string "ping" messages, responds with string "pong".
-        This task sends pings at the configured interval to keep the connection alive.
+        OKX closes connections that receive nothing for 30 seconds and
+        answers a text "ping" with "pong". Rather than pinging on a fixed
+        cadence, the timer re-arms itself for the moment the connection
+        would next become idle, so an active stream never sends pings.
         """
-        try:
-            while self.is_connected:
-                await asyncio.sleep(self.ping_interval)
-
-                if self._ws:
-                    try:
-                        # OKX uses string "ping", not binary ping frames
-                        await self._ws.send("ping")
-                        logger.debug("websocket_ping_sent", exchange="okx", url=self.url)
-                    except Exception as e:
-                        logger.error(
-                            "websocket_ping_error",
-                            exchange="okx",
-                            url=self.url,
-                            error=str(e),
-                        )
-                        self._connected = False
-                        break
+        self._ping_handle = None
+        if not self.is_connected:
+            return
 
-        except asyncio.CancelledError:
-            logger.debug("websocket_ping_task_cancelled", exchange="okx", url=self.url)
+        last_activity_ns = max(self._last_message_ns, self._connect_mono_ns)
+        idle = (time.monotonic_ns() - last_activity_ns) / 1e9
+        if idle < self.ping_interval:
+            self._schedule_ping(self.ping_interval - idle)
+            return
+
+        self._ping_send_task = asyncio.get_running_loop().create_task(self._send_ping())
+        self._schedule_ping(self.ping_interval)
+
+    async def _send_ping(self) -> None:
+        """Send OKX's text heartbeat; a failed send marks the client disconnected."""
+        ws = self._ws
+        if ws is None:
+            return
+        try:
+            # OKX uses string "ping", not binary ping frames
+            await ws.send("ping")
+            self._log.debug("websocket_ping_sent")
         except Exception as e:
-            logger.error(
-                "websocket_ping_task_error", exchange="okx", url=self.url, error=str(e)
+            self._log.error(
+                "websocket_ping_error",
+                error=str(e),
             )
+            self._connected = False
 
     def __repr__(self) -> str:
         """Return string representation."""
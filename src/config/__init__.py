@@ -35,7 +35,7 @@ Modules:
     models: Pydantic models for configuration validation
 """
 
-from src.config.loader import ConfigLoadError, ConfigLoader, load_config
+from src.config.loader import ConfigLoadError, ConfigLoader, clear_config_cache, load_config
 from src.config.models import (
     # Enums
     AlertCondition,
@@ -84,6 +84,7 @@ from src.config.models import (
 __all__: list[str] = [
     # Loader
     "load_config",
+    "clear_config_cache",
     "ConfigLoader",
     "ConfigLoadError",
     # Enums
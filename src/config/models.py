@@ -21,9 +21,9 @@ Example:
 
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 # =============================================================================
@@ -180,6 +180,15 @@ class StreamSettings(BaseModel):
         default=None,
         description="Order book channel name (OKX)",
     )
+    ticker_channel: Optional[str] = Field(
+        default=None,
+        description="Ticker channel name (OKX)",
+    )
+    subscribe_batch_size: int = Field(
+        default=100,
+        description="Maximum channels per subscription message (OKX)",
+        ge=1,
+    )
 
 
 class ExchangeConfig(BaseModel):
@@ -478,7 +487,12 @@ class AlertDefinitionConfig(BaseModel):
 
 
 class ThresholdValue(BaseModel):
-    """Threshold configuration for a specific alert type and instrument."""
+    """
+    Threshold configuration for a specific alert type and instrument.
+
+    YAML floats are converted by pydantic through their shortest repr,
+    so 0.1 becomes Decimal("0.1") rather than the binary expansion.
+    """
 
     model_config = {"frozen": True, "extra": "forbid"}
 
@@ -492,24 +506,6 @@ class ThresholdValue(BaseModel):
         ge=Decimal("0"),
     )
 
-    @field_validator("threshold", mode="before")
-    @classmethod
-    def coerce_threshold(cls, v: Any) -> Decimal:
-        """Convert threshold to Decimal."""
-        if isinstance(v, (int, float)):
-            return Decimal(str(v))
-        return v
-
-    @field_validator("zscore", mode="before")
-    @classmethod
-    def coerce_zscore(cls, v: Any) -> Optional[Decimal]:
-        """Convert zscore to Decimal."""
-        if v is None:
-            return None
-        if isinstance(v, (int, float)):
-            return Decimal(str(v))
-        return v
-
 
 class ChannelConfig(BaseModel):
     """Configuration for a notification channel."""
@@ -569,6 +565,21 @@ class AlertsConfig(BaseModel):
         description="Notification channel configurations",
     )
 
+    # Flat (instrument, alert_type) view of thresholds for single-lookup access,
+    # with the "*" defaults merged into every configured instrument
+    _threshold_index: Dict[Tuple[str, str], ThresholdValue] = PrivateAttr(
+        default_factory=dict
+    )
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the flat threshold index from the nested thresholds."""
+        defaults = self.thresholds.get("*", {})
+        index: Dict[Tuple[str, str], ThresholdValue] = {}
+        for instrument, alert_thresholds in self.thresholds.items():
+            for alert_type, value in {**defaults, **alert_thresholds}.items():
+                index[(instrument, alert_type)] = value
+        self._threshold_index = index
+
     def get_threshold(
         self, instrument: str, alert_type: str
     ) -> Optional[ThresholdValue]:
@@ -584,17 +595,15 @@ class AlertsConfig(BaseModel):
         Returns:
             Optional[ThresholdValue]: Threshold config or None if not found.
         """
-        # Try instrument-specific threshold
-        if instrument in self.thresholds:
-            if alert_type in self.thresholds[instrument]:
-                return self.thresholds[instrument][alert_type]
+        index = self._threshold_index
 
-        # Fall back to default
-        if "*" in self.thresholds:
-            if alert_type in self.thresholds["*"]:
-                return self.thresholds["*"][alert_type]
+        # Configured instruments already carry the defaults
+        threshold = index.get((instrument, alert_type))
+        if threshold is not None:
+            return threshold
 
-        return None
+        # Fall back to default for instruments without their own section
+        return index.get(("*", alert_type))
 
     def get_definition(self, alert_type: str) -> Optional[AlertDefinitionConfig]:
         """
@@ -656,14 +665,6 @@ class ZScoreConfig(BaseModel):
         ge=1,
     )
 
-    @field_validator("min_std", mode="before")
-    @classmethod
-    def coerce_min_std(cls, v: Any) -> Decimal:
-        """Convert min_std to Decimal."""
-        if isinstance(v, (int, float)):
-            return Decimal(str(v))
-        return v
-
 
 class GapHandlingConfig(BaseModel):
     """Gap detection and handling configuration."""
@@ -696,7 +697,7 @@ class GapHandlingConfig(BaseModel):
 class RegimeDetectionConfig(BaseModel):
     """Regime detection configuration (future feature)."""
 
-    model_config = {"frozen": True, "extra": "forbid"}
+    model_config = {"frozen": True, "extra": "forbid", "defer_build": True}
 
     enabled: bool = Field(
         default=False,
@@ -707,7 +708,7 @@ class RegimeDetectionConfig(BaseModel):
 class BackfillConfig(BaseModel):
     """Data backfill configuration (future feature)."""
 
-    model_config = {"frozen": True, "extra": "forbid"}
+    model_config = {"frozen": True, "extra": "forbid", "defer_build": True}
 
     enabled: bool = Field(
         default=False,
@@ -807,7 +808,7 @@ class StorageConfig(BaseModel):
 class DashboardConfig(BaseModel):
     """Dashboard configuration."""
 
-    model_config = {"frozen": True, "extra": "forbid"}
+    model_config = {"frozen": True, "extra": "forbid", "defer_build": True}
 
     current_state_refresh_ms: int = Field(
         default=1000,
@@ -847,7 +848,7 @@ class DashboardConfig(BaseModel):
 class LoggingConfig(BaseModel):
     """Logging configuration."""
 
-    model_config = {"frozen": True, "extra": "forbid"}
+    model_config = {"frozen": True, "extra": "forbid", "defer_build": True}
 
     format: LogFormat = Field(
         default=LogFormat.JSON,
@@ -1009,6 +1010,30 @@ class AppConfig(BaseModel):
         description="Application log level",
     )
 
+    # Lookup indexes for the per-tick getters; the first entry wins on duplicates
+    _instrument_index: Dict[str, InstrumentConfig] = PrivateAttr(default_factory=dict)
+    _perp_to_spot: Dict[str, str] = PrivateAttr(default_factory=dict)
+    # The config is frozen, so the enabled subsets are computed once
+    _enabled_exchanges: List[str] = PrivateAttr(default_factory=list)
+    _enabled_instruments: List[InstrumentConfig] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the lookup indexes and the enabled exchange/instrument lists."""
+        instrument_index: Dict[str, InstrumentConfig] = {}
+        for instrument in self.instruments:
+            instrument_index.setdefault(instrument.id, instrument)
+        self._instrument_index = instrument_index
+
+        perp_to_spot: Dict[str, str] = {}
+        for pair in self.basis_pairs:
+            perp_to_spot.setdefault(pair.perp, pair.spot)
+        self._perp_to_spot = perp_to_spot
+
+        self._enabled_exchanges = [
+            name for name, config in self.exchanges.items() if config.enabled
+        ]
+        self._enabled_instruments = [inst for inst in self.instruments if inst.enabled]
+
     @model_validator(mode="after")
     def validate_config(self) -> "AppConfig":
         """Validate cross-references in configuration."""
@@ -1044,28 +1069,31 @@ class AppConfig(BaseModel):
         Returns:
             Optional[InstrumentConfig]: Instrument config or None if not found.
         """
-        for instrument in self.instruments:
-            if instrument.id == instrument_id:
-                return instrument
-        return None
+        return self._instrument_index.get(instrument_id)
 
     def get_enabled_exchanges(self) -> List[str]:
         """
         Get list of enabled exchange names.
 
+        The list is computed once per config and shared between callers;
+        do not modify it.
+
         Returns:
             List[str]: Names of enabled exchanges.
         """
-        return [name for name, config in self.exchanges.items() if config.enabled]
+        return self._enabled_exchanges
 
     def get_enabled_instruments(self) -> List[InstrumentConfig]:
         """
         Get list of enabled instruments.
 
+        The list is computed once per config and shared between callers;
+        do not modify it.
+
         Returns:
             List[InstrumentConfig]: Enabled instrument configurations.
         """
-        return [inst for inst in self.instruments if inst.enabled]
+        return self._enabled_instruments
 
     def get_spot_for_perp(self, perp_id: str) -> Optional[str]:
         """
@@ -1077,7 +1105,4 @@ class AppConfig(BaseModel):
         Returns:
             Optional[str]: Spot instrument ID or None if no pair defined.
         """
-        for pair in self.basis_pairs:
-            if pair.perp == perp_id:
-                return pair.spot
-        return None
+        return self._perp_to_spot.get(perp_id)
@@ -326,6 +326,54 @@ async def test_websocket_stream_messages():
         assert received[1]["u"] == 101
 
 
+@pytest.mark.asyncio
+async def test_websocket_start_combines_streams():
+    """Test that registered streams are multiplexed over one connection."""
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+        mock_ws = AsyncMock()
+        mock_connect.return_value = mock_ws
+
+        client = BinanceWebSocketClient(url="wss://fstream.binance.com/stream")
+        client.add_streams(["btcusdt@depth20@100ms", "btcusdt@ticker"])
+        client.add_streams(["btcusdt@ticker", "btcusdt@markPrice"])
+        await client.start()
+
+        assert client.is_connected
+        assert client.url == (
+            "wss://fstream.binance.com/stream"
+            "?streams=btcusdt@depth20@100ms/btcusdt@ticker/btcusdt@markPrice"
+        )
+        mock_connect.assert_called_once()
+        assert mock_connect.call_args.args[0] == client.url
+
+
+@pytest.mark.asyncio
+async def test_websocket_combined_stream_unwraps_data():
+    """Test that combined-stream frames are unwrapped to their payload."""
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+        mock_ws = AsyncMock()
+        mock_ws.recv.side_effect = [
+            '{"stream":"btcusdt@depth20@100ms","data":{"e":"depthUpdate","u":100}}',
+            '{"e":"depthUpdate","u":101}',
+        ]
+        mock_connect.return_value = mock_ws
+
+        client = BinanceWebSocketClient(url="wss://fstream.binance.com/stream")
+        client.add_streams(["btcusdt@depth20@100ms"])
+        await client.start()
+
+        received = []
+        async for message in client.stream_messages():
+            received.append(message)
+            if len(received) >= 2:
+                break
+
+        assert received == [
+            {"e": "depthUpdate", "u": 100},
+            {"e": "depthUpdate", "u": 101},
+        ]
+
+
 # =============================================================================
 # REST CLIENT TESTS
 # =============================================================================
@@ -496,15 +544,17 @@ async def test_adapter_subscribe(exchange_config, instrument_configs):
     ) as mock_ws_class:
         mock_ws = AsyncMock()
         mock_ws.is_connected = True
-        mock_ws.url = "wss://fstream.binance.com/stream"
+        mock_ws.add_streams = Mock()
         mock_ws_class.return_value = mock_ws
 
         adapter = BinanceAdapter(exchange_config, instrument_configs)
         await adapter.connect()
         await adapter.subscribe(["BTC-USDT-PERP"])
 
-        # Should have reconnected with combined stream URL
-        assert "btcusdt@depth20@100ms" in mock_ws.url.lower()
+        # Should have restarted with the streams multiplexed on one socket
+        streams = mock_ws.add_streams.call_args_list[0].args[0]
+        assert "btcusdt@depth20@100ms" in streams
+        mock_ws.start.assert_awaited()
 
 
 # =============================================================================
@@ -0,0 +1,208 @@
+"""
+Unit tests for the YAML configuration loader.
+
+Tests load the shipped config/ directory from a temporary copy so that
+files can be modified without touching the repository.
+"""
+
+import shutil
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from src.config.loader import ConfigLoadError, ConfigLoader, clear_config_cache, load_config
+from src.config.models import ThresholdValue, ZScoreConfig
+
+CONFIG_DIR = Path(__file__).resolve().parents[2] / "config"
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path) -> Path:
+    """Copy the shipped configuration into a temporary directory."""
+    target = tmp_path / "config"
+    shutil.copytree(CONFIG_DIR, target)
+    return target
+
+
+class TestConfigCache:
+    """Tests for the fingerprint-keyed AppConfig cache."""
+
+    def test_unchanged_inputs_return_cached_config(self, config_dir: Path) -> None:
+        """Test that loading twice without changes returns the same instance."""
+        first = load_config(config_dir)
+        second = ConfigLoader(config_dir).load()
+
+        assert second is first
+
+    def test_file_change_reloads(self, config_dir: Path) -> None:
+        """Test that modifying a YAML file invalidates the cache."""
+        first = load_config(config_dir)
+
+        with open(config_dir / "features.yaml", "a", encoding="utf-8") as f:
+            f.write("\n# touched\n")
+
+        assert load_config(config_dir) is not first
+
+    def test_clear_config_cache(self, config_dir: Path) -> None:
+        """Test that clearing the cache forces a reload."""
+        first = load_config(config_dir)
+        clear_config_cache()
+
+        assert load_config(config_dir) is not first
+
+    def test_env_change_reloads(
+        self, config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that changing an environment override invalidates the cache."""
+        monkeypatch.setenv("REDIS_URL", "redis://first:6379")
+        first = load_config(config_dir)
+
+        monkeypatch.setenv("REDIS_URL", "redis://second:6379")
+        second = load_config(config_dir)
+
+        assert second is not first
+        assert second.redis.url == "redis://second:6379"
+
+
+class TestModelValidation:
+    """Tests for building config models straight from the YAML dicts."""
+
+    def test_shipped_config_loads(self, config_dir: Path) -> None:
+        """Test that the shipped configuration validates, defaults included."""
+        config = load_config(config_dir)
+
+        okx = config.exchanges["okx"]
+        assert okx.streams.ticker_channel == "tickers"
+        assert config.exchanges["binance"].streams.ticker_channel is None
+        assert config.alerts.global_settings.throttle_seconds > 0
+
+    def test_invalid_value_reports_file(self, config_dir: Path) -> None:
+        """Test that a validation error is reported against its YAML file."""
+        path = config_dir / "exchanges.yaml"
+        text = path.read_text(encoding="utf-8")
+        path.write_text(
+            text.replace("exchanges:", "exchanges:\n  broken:\n    enabled: maybe", 1),
+            encoding="utf-8",
+        )
+
+        with pytest.raises(ConfigLoadError) as exc_info:
+            ConfigLoader(config_dir).load()
+
+        assert exc_info.value.file_path == path
+
+    def test_float_thresholds_become_exact_decimals(self) -> None:
+        """Test that YAML floats map to the Decimal of their written value."""
+        value = ThresholdValue(threshold=0.1, zscore=2)
+
+        assert value.threshold == Decimal("0.1")
+        assert value.zscore == Decimal("2")
+        assert ZScoreConfig(min_std=0.0001).min_std == Decimal("0.0001")
+
+
+class TestInstrumentLookup:
+    """Tests for the AppConfig instrument and basis pair indexes."""
+
+    def test_get_instrument_and_spot_for_perp(self, config_dir: Path) -> None:
+        """Test indexed lookups agree with the instrument and pair lists."""
+        config = load_config(config_dir)
+
+        for instrument in config.instruments:
+            assert config.get_instrument(instrument.id) is instrument
+        for pair in config.basis_pairs:
+            assert config.get_spot_for_perp(pair.perp) == pair.spot
+        assert config.get_instrument("UNKNOWN-PERP") is None
+        assert config.get_spot_for_perp("UNKNOWN-PERP") is None
+
+    def test_enabled_lists_computed_once(self, config_dir: Path) -> None:
+        """Test that the enabled subsets are filtered once and reused."""
+        config = load_config(config_dir)
+
+        instruments = config.get_enabled_instruments()
+        assert instruments == [i for i in config.instruments if i.enabled]
+        assert config.get_enabled_instruments() is instruments
+        assert config.get_enabled_exchanges() == [
+            name for name, exchange in config.exchanges.items() if exchange.enabled
+        ]
+
+    def test_indexes_not_serialized(self, config_dir: Path) -> None:
+        """Test that the private indexes stay out of model_dump."""
+        dumped = load_config(config_dir).model_dump()
+
+        assert "_instrument_index" not in dumped
+        assert "_perp_to_spot" not in dumped
+        assert "_enabled_instruments" not in dumped
+
+
+class TestThresholdLookup:
+    """Tests for AlertsConfig.get_threshold over the flat threshold index."""
+
+    def test_instrument_threshold_and_default_fallback(self, config_dir: Path) -> None:
+        """Test instrument-specific lookup, "*" fallback and misses."""
+        alerts = load_config(config_dir).alerts
+
+        assert (
+            alerts.get_threshold("BTC-USDT-PERP", "spread_warning")
+            == alerts.thresholds["BTC-USDT-PERP"]["spread_warning"]
+        )
+        assert (
+            alerts.get_threshold("UNKNOWN-PERP", "spread_warning")
+            == alerts.thresholds["*"]["spread_warning"]
+        )
+        assert alerts.get_threshold("UNKNOWN-PERP", "no_such_alert") is None
+
+    def test_defaults_merged_into_configured_instruments(self, config_dir: Path) -> None:
+        """Test that a configured instrument inherits "*" thresholds it lacks."""
+        alerts = load_config(config_dir).alerts
+        defaults = alerts.thresholds["*"]
+        specific = alerts.thresholds["BTC-USDT-SPOT"]
+
+        inherited = [name for name in defaults if name not in specific]
+        assert inherited
+        for alert_type in inherited:
+            assert alerts.get_threshold("BTC-USDT-SPOT", alert_type) == defaults[alert_type]
+
+
+class TestStringInterning:
+    """Tests for interning of YAML string scalars."""
+
+    def test_keys_and_ids_are_interned(self, config_dir: Path) -> None:
+        """Test that exchange names and instrument IDs are interned strings."""
+        config = load_config(config_dir)
+
+        for name in config.exchanges:
+            assert name is sys.intern("".join(name))
+        for instrument in config.instruments:
+            assert instrument.id is sys.intern("".join(instrument.id))
+
+
+class TestCompiledConfig:
+    """Tests for the JSON snapshot of the validated YAML sections."""
+
+    def test_snapshot_reused_until_yaml_changes(
+        self, config_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the snapshot is written, reused, and rebuilt on change."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("DATABASE_URL", "postgresql://user:secret@db:5432/app")
+
+        first = ConfigLoader(config_dir, cache_dir=cache_dir).load()
+        snapshot = cache_dir / "appconfig.json"
+        assert snapshot.exists()
+        assert b"secret" not in snapshot.read_bytes()
+
+        # Reading the snapshot must not need the YAML parser
+        clear_config_cache()
+        monkeypatch.setattr(ConfigLoader, "_load_yaml", None)
+        second = ConfigLoader(config_dir, cache_dir=cache_dir).load()
+        assert second == first
+        monkeypatch.undo()
+
+        with open(config_dir / "features.yaml", "a", encoding="utf-8") as f:
+            f.write("\n# touched\n")
+        clear_config_cache()
+        previous = snapshot.read_bytes()
+        ConfigLoader(config_dir, cache_dir=cache_dir).load()
+
+        assert snapshot.read_bytes() != previous
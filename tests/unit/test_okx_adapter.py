@@ -18,11 +18,13 @@ Test Strategy:
 
 import asyncio
 import json
+import time
 from datetime import datetime, timezone
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from websockets.exceptions import ConnectionClosed
 
 from src.adapters.okx.adapter import OKXAdapter
 from src.adapters.okx.normalizer import OKXNormalizer
@@ -197,6 +199,7 @@ def test_normalize_orderbook_valid(okx_orderbook_message):
     assert snapshot.exchange == "okx"
     assert snapshot.instrument == "BTC-USDT-PERP"
     assert snapshot.sequence_id == 123456789
+    assert snapshot.timestamp == datetime(2009, 2, 13, 23, 31, 30, 123000, tzinfo=timezone.utc)
 
     # Check bids (sorted descending)
     assert len(snapshot.bids) == 2
@@ -262,6 +265,130 @@ def test_normalize_orderbook_invalid_decimal():
         )
 
 
+def test_normalize_orderbook_level_parsing():
+    """Test that levels keep exact decimal values and zero levels are dropped."""
+    message = {
+        "arg": {"channel": "books", "instId": "BTC-USDT-SWAP"},
+        "data": [
+            {
+                "asks": [
+                    ["50001.5", "0.00000001", "0", "1"],
+                    ["50002.0", "0", "0", "0"],
+                    ["50003.25", "1000000", "0", "4"],
+                ],
+                "bids": [["50000.0", "0.0", "0", "0"], ["49999.9", "2.50", "0", "3"]],
+                "ts": "1234567890123",
+                "seqId": 123456789,
+            }
+        ],
+    }
+
+    snapshot = OKXNormalizer.normalize_orderbook(
+        raw_message=message,
+        instrument="BTC-USDT-PERP",
+    )
+
+    assert [(level.price, level.quantity) for level in snapshot.asks] == [
+        (Decimal("50001.5"), Decimal("0.00000001")),
+        (Decimal("50003.25"), Decimal("1000000")),
+    ]
+    assert [(level.price, level.quantity) for level in snapshot.bids] == [
+        (Decimal("49999.9"), Decimal("2.50")),
+    ]
+    assert str(snapshot.bids[0].quantity) == "2.50"
+
+
+@pytest.mark.parametrize("price", ["-5", "Infinity", "NaN"])
+def test_normalize_orderbook_invalid_price(price):
+    """Test that negative or non-finite prices are rejected."""
+    message = {
+        "arg": {"channel": "books", "instId": "BTC-USDT-SWAP"},
+        "data": [
+            {
+                "asks": [[price, "1.0", "0", "1"]],
+                "bids": [["49999.0", "1.0", "0", "1"]],
+                "ts": "1234567890123",
+                "seqId": 123456789,
+            }
+        ],
+    }
+
+    with pytest.raises(ValueError):
+        OKXNormalizer.normalize_orderbook(
+            raw_message=message,
+            instrument="BTC-USDT-PERP",
+        )
+
+
+@pytest.mark.parametrize("quantity", ["Infinity", "-Infinity", "NaN"])
+def test_normalize_orderbook_invalid_quantity(quantity):
+    """Test that non-finite quantities are rejected."""
+    message = {
+        "arg": {"channel": "books", "instId": "BTC-USDT-SWAP"},
+        "data": [
+            {
+                "asks": [["50001.0", "1.0", "0", "1"]],
+                "bids": [["49999.0", quantity, "0", "1"]],
+                "ts": "1234567890123",
+                "seqId": 123456789,
+            }
+        ],
+    }
+
+    with pytest.raises(ValueError):
+        OKXNormalizer.normalize_orderbook(
+            raw_message=message,
+            instrument="BTC-USDT-PERP",
+        )
+
+
+def test_normalize_orderbook_unordered_levels(monkeypatch):
+    """Test out-of-order levels are rejected, or re-sorted when validation is on."""
+    message = {
+        "arg": {"channel": "books", "instId": "BTC-USDT-SWAP"},
+        "data": [
+            {
+                "asks": [["50002.0", "1.0", "0", "1"], ["50001.0", "1.0", "0", "1"]],
+                "bids": [["49999.0", "1.0", "0", "1"], ["50000.0", "1.0", "0", "1"]],
+                "ts": "1234567890123",
+                "seqId": 123456789,
+            }
+        ],
+    }
+
+    # Default: feed order is trusted, so the snapshot validator rejects it
+    with pytest.raises(ValueError, match="Invalid data"):
+        OKXNormalizer.normalize_orderbook(
+            raw_message=message,
+            instrument="BTC-USDT-PERP",
+        )
+
+    monkeypatch.setattr("src.adapters.okx.normalizer._VALIDATE_SORT", True)
+    snapshot = OKXNormalizer.normalize_orderbook(
+        raw_message=message,
+        instrument="BTC-USDT-PERP",
+    )
+
+    assert [level.price for level in snapshot.bids] == [Decimal("50000.0"), Decimal("49999.0")]
+    assert [level.price for level in snapshot.asks] == [Decimal("50001.0"), Decimal("50002.0")]
+
+
+def test_normalize_orderbook_batch(okx_orderbook_message):
+    """Test batch normalization shares one local timestamp."""
+    next_message = {
+        **okx_orderbook_message,
+        "data": [{**okx_orderbook_message["data"][0], "seqId": 123456790}],
+    }
+
+    snapshots = OKXNormalizer.normalize_orderbook_batch(
+        raw_messages=[okx_orderbook_message, next_message],
+        instrument="BTC-USDT-PERP",
+    )
+
+    assert [s.sequence_id for s in snapshots] == [123456789, 123456790]
+    assert snapshots[0].local_timestamp == snapshots[1].local_timestamp
+
+
 def test_normalize_ticker_with_mark_price(okx_ticker_message, okx_mark_price_message):
     """Test ticker normalization with mark price data (perpetual)."""
     ticker_data = okx_ticker_message["data"][0]
@@ -348,6 +475,29 @@ async def test_websocket_connect():
         await client.disconnect()
 
 
+@pytest.mark.asyncio
+async def test_websocket_disconnect_close_timeout(monkeypatch):
+    """Test that a hanging close handshake is bounded and the transport aborted."""
+    monkeypatch.setattr("src.adapters.okx.websocket._CLOSE_TIMEOUT", 0.01)
+
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+        async def hang():
+            await asyncio.sleep(10)
+
+        mock_ws = AsyncMock()
+        mock_ws.close.side_effect = hang
+        mock_ws.transport = MagicMock()
+        mock_connect.return_value = mock_ws
+
+        client = OKXWebSocketClient(url="wss://ws.okx.com:8443/ws/v5/public")
+        await client.connect()
+
+        await asyncio.wait_for(client.disconnect(), timeout=1)
+
+        mock_ws.transport.abort.assert_called_once()
+        assert not client.is_connected
+
+
 @pytest.mark.asyncio
 async def test_websocket_subscribe():
     """Test WebSocket subscription."""
@@ -375,10 +525,39 @@ async def test_websocket_subscribe():
         await client.disconnect()
 
 
+@pytest.mark.asyncio
+async def test_websocket_subscribe_batches():
+    """Test that large subscriptions are split into bounded messages."""
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+        mock_ws = AsyncMock()
+        mock_connect.return_value = mock_ws
+
+        client = OKXWebSocketClient(
+            url="wss://ws.okx.com:8443/ws/v5/public",
+            subscribe_batch_size=2,
+        )
+        await client.connect()
+
+        channels = [
+            {"channel": "books5", "instId": f"INST{i}-USDT"} for i in range(5)
+        ]
+        await client.subscribe(channels)
+
+        sent = [
+            json.loads(call.args[0])
+            for call in mock_ws.send.call_args_list
+            if call.args[0] != "ping"
+        ]
+        assert [len(message["args"]) for message in sent] == [2, 2, 1]
+        assert [arg for message in sent for arg in message["args"]] == channels
+
+        await client.disconnect()
+
+
 @pytest.mark.asyncio
 async def test_websocket_ping_pong():
     """Test WebSocket ping/pong mechanism."""
-    with patch("websockets.connect") as mock_connect:
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
         mock_ws = AsyncMock()
         mock_ws.closed = False
         mock_connect.return_value = mock_ws
@@ -399,9 +578,114 @@ async def test_websocket_ping_pong():
                      if call[0][0] == "ping"]
         assert len(ping_calls) > 0
 
+        # Library keepalive is enabled with the configured interval
+        assert mock_connect.call_args.kwargs["ping_interval"] == 0.1
+
+        # No idle ping while messages keep arriving
+        client._last_message_ns = time.monotonic_ns()
+        await asyncio.sleep(0.01)  # Let any in-flight ping send finish
+        mock_ws.send.reset_mock()
+        for _ in range(3):
+            client._last_message_ns = time.monotonic_ns()
+            await asyncio.sleep(0.05)
+        assert not mock_ws.send.called
+
+        await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_websocket_pong_not_parsed():
+    """Test that text pong replies are skipped without a JSON parse warning."""
+    frames = [
+        "pong",
+        json.dumps({"arg": {"channel": "books5", "instId": "BTC-USDT-SWAP"}, "data": [{}]}),
+    ]
+
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+        mock_ws = AsyncMock()
+        mock_ws.recv.side_effect = frames
+        mock_connect.return_value = mock_ws
+
+        client = OKXWebSocketClient(url="wss://ws.okx.com:8443/ws/v5/public")
+        await client.connect()
+
+        with patch.object(client, "_log") as mock_logger:
+            message = await client.stream_messages().__anext__()
+
+        assert message["arg"]["channel"] == "books5"
+        assert not mock_logger.warning.called
+
+        # Receive time is tracked as monotonic ns and exposed as UTC datetime
+        lag = datetime.now(timezone.utc) - client.last_message_at
+        assert 0 <= lag.total_seconds() < 1
+
         await client.disconnect()
 
 
+@pytest.mark.asyncio
+async def test_websocket_non_object_frames_skipped():
+    """Test that non-object JSON frames are skipped without stopping the router."""
+    frames = [
+        json.dumps("no data here"),
+        json.dumps(["data"]),
+        json.dumps("pong"),
+        json.dumps({"arg": {"channel": "books5", "instId": "BTC-USDT-SWAP"}, "data": [{}]}),
+    ]
+
+    async def mock_recv():
+        if frames:
+            return frames.pop(0)
+        await asyncio.Event().wait()
+
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+        mock_ws = AsyncMock()
+        mock_ws.recv = mock_recv
+        mock_connect.return_value = mock_ws
+
+        client = OKXWebSocketClient(url="wss://ws.okx.com:8443/ws/v5/public")
+        await client.connect()
+
+        with patch.object(client, "_log") as mock_logger:
+            books = client.subscribe_channel("books5")
+            message = await asyncio.wait_for(books.get(), timeout=1)
+
+        assert message["arg"]["channel"] == "books5"
+        assert client.stream_error is None
+        assert mock_logger.warning.call_count == 2
+
+        await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_websocket_run_handler():
+    """Test that run() pushes each data message to the handler."""
+    frames = [
+        json.dumps({"event": "subscribe", "arg": {"channel": "books5"}}),
+        json.dumps({"arg": {"channel": "books5", "instId": "BTC-USDT-SWAP"}, "data": [{}]}),
+        json.dumps({"arg": {"channel": "tickers", "instId": "BTC-USDT-SWAP"}, "data": [{}]}),
+    ]
+
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+        mock_ws = AsyncMock()
+        mock_ws.recv.side_effect = frames
+        mock_connect.return_value = mock_ws
+
+        client = OKXWebSocketClient(url="wss://ws.okx.com:8443/ws/v5/public")
+        await client.connect()
+
+        received = []
+
+        async def handle(message):
+            received.append(message["arg"]["channel"])
+            if len(received) == 2:
+                await client.disconnect()
+
+        await asyncio.wait_for(client.run(handle), timeout=1)
+
+        # Control frames are not delivered; run() returns after disconnect
+        assert received == ["books5", "tickers"]
+
+
 @pytest.mark.asyncio
 async def test_websocket_reconnect():
     """Test WebSocket reconnection on disconnect."""
@@ -430,6 +714,154 @@ async def test_websocket_reconnect():
         await client.disconnect()
 
 
+def test_websocket_backoff_table():
+    """Test that reconnect delays double per attempt up to the 60s cap."""
+    client = OKXWebSocketClient(
+        url="wss://ws.okx.com:8443/ws/v5/public",
+        reconnect_delay=5,
+        max_reconnect_attempts=6,
+    )
+
+    assert client._backoff_table == [5, 10, 20, 40, 60.0, 60.0, 60.0]
+
+
+@pytest.mark.asyncio
+async def test_websocket_reconnect_resends_subscriptions():
+    """Test that reconnecting resends the cached subscribe frames."""
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+        mock_ws1 = AsyncMock()
+        mock_ws2 = AsyncMock()
+        mock_connect.side_effect = [mock_ws1, mock_ws2]
+
+        client = OKXWebSocketClient(
+            url="wss://ws.okx.com:8443/ws/v5/public",
+            reconnect_delay=0.01,
+        )
+        await client.connect()
+        await client.subscribe([{"channel": "books5", "instId": "BTC-USDT-SWAP"}])
+        subscribe_frames = [call.args[0] for call in mock_ws1.send.call_args_list]
+
+        client._connected = False
+        await client._reconnect()
+
+        assert client.is_connected
+        assert [call.args[0] for call in mock_ws2.send.call_args_list] == subscribe_frames
+
+        # The hostname is dialed, so connect can fall back across addresses
+        assert "host" not in mock_connect.call_args.kwargs
+
+        await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_websocket_channel_fan_out():
+    """Test that channel queues only receive their own channels' messages."""
+    frames = [
+        json.dumps({"arg": {"channel": "books5", "instId": "BTC-USDT-SWAP"}, "data": [{}]}),
+        json.dumps({"arg": {"channel": "tickers", "instId": "BTC-USDT-SWAP"}, "data": [{}]}),
+    ]
+
+    async def mock_recv():
+        if frames:
+            return frames.pop(0)
+        await asyncio.Event().wait()
+
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+        mock_ws = AsyncMock()
+        mock_ws.recv = mock_recv
+        mock_connect.return_value = mock_ws
+
+        client = OKXWebSocketClient(url="wss://ws.okx.com:8443/ws/v5/public")
+        await client.connect()
+
+        books = client.subscribe_channel("books5")
+        tickers = client.subscribe_channel("tickers", "mark-price")
+
+        book_message = await asyncio.wait_for(books.get(), timeout=1)
+        ticker_message = await asyncio.wait_for(tickers.get(), timeout=1)
+
+        assert book_message["arg"]["channel"] == "books5"
+        assert ticker_message["arg"]["channel"] == "tickers"
+        assert books.empty()
+        assert tickers.empty()
+
+        # Consumers are woken up with None once the client disconnects
+        await client.disconnect()
+        assert books.get_nowait() is None
+        assert tickers.get_nowait() is None
+        assert client.stream_error is None
+
+
+@pytest.mark.asyncio
+async def test_websocket_channel_router_keeps_error():
+    """Test that the error stopping the router is kept for consumers."""
+
+    async def mock_recv():
+        raise ConnectionClosed(None, None)
+
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+        mock_ws = AsyncMock()
+        mock_ws.recv = mock_recv
+        mock_connect.return_value = mock_ws
+
+        client = OKXWebSocketClient(
+            url="wss://ws.okx.com:8443/ws/v5/public",
+            max_reconnect_attempts=0,
+        )
+        await client.connect()
+
+        books = client.subscribe_channel("books5")
+
+        assert await asyncio.wait_for(books.get(), timeout=1) is None
+        assert isinstance(client.stream_error, ConnectionError)
+
+        await client.disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_attempts", [1, 2, 3])
+async def test_websocket_reconnect_exhausted_raises(max_attempts):
+    """Test that exhausting reconnect attempts raises for any attempt count."""
+    real_sleep = asyncio.sleep
+
+    async def fast_sleep(delay):
+        # Skip backoff delays but still yield, so wait_for can time out
+        await real_sleep(0)
+
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect, patch(
+        "asyncio.sleep", fast_sleep
+    ):
+        mock_connect.side_effect = OSError("unreachable")
+
+        client = OKXWebSocketClient(
+            url="wss://ws.okx.com:8443/ws/v5/public",
+            max_reconnect_attempts=max_attempts,
+            reconnect_delay=0,
+        )
+        handler = AsyncMock()
+
+        with pytest.raises(ConnectionError, match="Max reconnection attempts"):
+            await asyncio.wait_for(client.run(handler), timeout=1)
+
+        assert mock_connect.call_count == max_attempts
+        handler.assert_not_called()
+
+
+def test_websocket_queue_overflow_warning_throttled():
+    """Test that dropped messages are counted and warned about sparingly."""
+    client = OKXWebSocketClient(url="wss://ws.okx.com:8443/ws/v5/public")
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+    with patch.object(client, "_log") as mock_log:
+        for i in range(5):
+            client._put_latest(queue, {"seq": i})
+
+    assert client.dropped_count == 4
+    assert queue.get_nowait() == {"seq": 4}
+    mock_log.warning.assert_called_once()
+    assert mock_log.warning.call_args.args[0] == "websocket_queue_overflow"
+
+
 # =============================================================================
 # REST CLIENT TESTS
 # =============================================================================
@@ -439,10 +871,11 @@ async def test_websocket_reconnect():
 async def test_rest_get_orderbook():
     """Test REST order book fetch."""
     with patch("aiohttp.ClientSession") as mock_session_class:
-        mock_session = AsyncMock()
+        mock_session = MagicMock()
+        mock_session.close = AsyncMock()
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={
+        mock_response.read = AsyncMock(return_value=json.dumps({
             "code": "0",
             "msg": "",
             "data": [
@@ -453,7 +886,7 @@ async def test_rest_get_orderbook():
                     "seqId": 123456789
                 }
             ]
-        })
+        }).encode())
 
         mock_session.request.return_value.__aenter__.return_value = mock_response
         mock_session_class.return_value = mock_session
@@ -477,27 +910,84 @@ async def test_rest_get_orderbook():
         await client.close()
 
 
+@pytest.mark.asyncio
+async def test_rest_shared_session():
+    """Test REST clients for the same base URL share one session."""
+    client_a = OKXRestClient(base_url="https://www.okx.com")
+    client_b = OKXRestClient(base_url="https://www.okx.com/")
+
+    session_a = await client_a._ensure_session()
+    session_b = await client_b._ensure_session()
+    assert session_a is session_b
+
+    # Session stays open while another client still uses it
+    await client_a.close()
+    assert not session_b.closed
+
+    await client_b.close()
+    assert session_b.closed
+
+
+@pytest.mark.asyncio
+async def test_rest_get_ticker_swap():
+    """Test SWAP ticker fetch combines mark price and tolerates funding failure."""
+    responses = {
+        "/api/v5/market/ticker": {
+            "code": "0",
+            "data": [{
+                "instId": "BTC-USDT-SWAP",
+                "last": "50000.0",
+                "high24h": "51000.0",
+                "low24h": "49000.0",
+                "vol24h": "1000.5",
+                "volCcy24h": "50025000",
+                "ts": "1234567890123",
+            }],
+        },
+        "/api/v5/public/mark-price": {
+            "code": "0",
+            "data": [{"markPx": "50001.5", "idxPx": "49999.0"}],
+        },
+    }
+
+    async def fake_request(method, endpoint, params=None):
+        if endpoint not in responses:
+            raise ConnectionError("funding rate unavailable")
+        return responses[endpoint]
+
+    client = OKXRestClient(base_url="https://www.okx.com")
+    with patch.object(client, "_request", side_effect=fake_request) as mock_request:
+        ticker = await client.get_ticker("BTC-USDT-SWAP", instrument="BTC-USDT-PERP")
+
+    assert mock_request.call_count == 3
+    assert ticker.last_price == Decimal("50000.0")
+    assert ticker.mark_price == Decimal("50001.5")
+    assert ticker.index_price == Decimal("49999.0")
+    assert ticker.funding_rate is None
+
+
 @pytest.mark.asyncio
 async def test_rest_rate_limiting():
-    """Test REST rate limiting."""
+    """Test REST token bucket allows a burst, then throttles."""
     with patch("aiohttp.ClientSession"):
         client = OKXRestClient(
             base_url="https://www.okx.com",
             rate_limit_per_second=10,
         )
 
-        # Make multiple requests and verify they're rate limited
         start_time = asyncio.get_event_loop().time()
 
-        # Trigger rate limit checks (mock requests)
-        for _ in range(3):
-            await client._rate_limit()
+        # Burst capacity is two seconds' worth of requests
+        await asyncio.gather(*(client._rate_limit() for _ in range(20)))
+        burst_elapsed = asyncio.get_event_loop().time() - start_time
+        assert burst_elapsed < 0.1
 
-        end_time = asyncio.get_event_loop().time()
-        elapsed = end_time - start_time
+        # Bucket is empty: the next 2 requests wait for refill (0.1s each)
+        for _ in range(2):
+            await client._rate_limit()
 
-        # Should take at least 0.2 seconds (3 requests at 10/sec = 0.1s each)
-        assert elapsed >= 0.2
+        elapsed = asyncio.get_event_loop().time() - start_time
+        assert elapsed >= 0.15
 
         await client.close()
 
@@ -506,14 +996,15 @@ async def test_rest_rate_limiting():
 async def test_rest_error_handling():
     """Test REST error handling for OKX API errors."""
     with patch("aiohttp.ClientSession") as mock_session_class:
-        mock_session = AsyncMock()
+        mock_session = MagicMock()
+        mock_session.close = AsyncMock()
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={
+        mock_response.read = AsyncMock(return_value=json.dumps({
             "code": "50001",  # OKX error code
             "msg": "Invalid request",
             "data": []
-        })
+        }).encode())
 
         mock_session.request.return_value.__aenter__.return_value = mock_response
         mock_session_class.return_value = mock_session
@@ -576,6 +1067,47 @@ def test_gap_detection(exchange_config, instrument_configs):
     assert gap is None
 
 
+def test_recent_gaps_window(exchange_config, instrument_configs):
+    """Test that gaps only count towards health for one hour."""
+    adapter = OKXAdapter(exchange_config, instrument_configs)
+
+    with patch("src.adapters.okx.adapter.time.monotonic", return_value=1000.0):
+        for _ in range(5):
+            adapter._record_gap()
+        assert adapter._has_recent_gaps()
+
+    with patch("src.adapters.okx.adapter.time.monotonic", return_value=4601.0):
+        assert adapter._recent_gap_count() == 0
+        assert not adapter._has_recent_gaps()
+
+
+def test_log_rate_limiting(exchange_config, instrument_configs):
+    """Test that repeated log events are suppressed and counted."""
+    adapter = OKXAdapter(exchange_config, instrument_configs)
+
+    with patch("src.adapters.okx.adapter.time.monotonic", return_value=100.0):
+        assert adapter._log_allowed("okx_gap_detected", "BTC-USDT-PERP") == 0
+        assert adapter._log_allowed("okx_gap_detected", "BTC-USDT-PERP") is None
+        assert adapter._log_allowed("okx_gap_detected", "BTC-USDT-PERP") is None
+        # Other instruments are limited independently
+        assert adapter._log_allowed("okx_gap_detected", "BTC-USDT-SPOT") == 0
+
+    with patch("src.adapters.okx.adapter.time.monotonic", return_value=101.5):
+        assert adapter._log_allowed("okx_gap_detected", "BTC-USDT-PERP") == 2
+
+
+def test_ticker_cache_bounded(exchange_config, instrument_configs):
+    """Test that ticker caches evict the oldest entries beyond their size."""
+    adapter = OKXAdapter(exchange_config, instrument_configs)
+    cache = adapter._ticker_cache
+    assert cache.maxsize == 4
+
+    for i in range(6):
+        cache[f"INST{i}-USDT"] = {"ts": str(i)}
+
+    assert list(cache) == ["INST2-USDT", "INST3-USDT", "INST4-USDT", "INST5-USDT"]
+
+
 @pytest.mark.asyncio
 async def test_health_check(exchange_config, instrument_configs):
     """Test health check."""
@@ -590,6 +1122,104 @@ async def test_health_check(exchange_config, instrument_configs):
     assert health.gaps_last_hour == 0
 
 
+@pytest.mark.asyncio
+async def test_stream_tickers_skips_unchanged(
+    exchange_config, instrument_configs, okx_ticker_message, okx_mark_price_message
+):
+    """Test that unchanged ticker/mark price pushes are not re-emitted."""
+    changed_mark_price = {
+        **okx_mark_price_message,
+        "data": [{**okx_mark_price_message["data"][0], "markPx": "50002.0"}],
+    }
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for message in (
+        okx_ticker_message,
+        okx_mark_price_message,
+        okx_mark_price_message,  # Same markPx: skipped
+        changed_mark_price,
+        None,
+    ):
+        queue.put_nowait(message)
+
+    adapter = OKXAdapter(exchange_config, instrument_configs)
+    adapter._ws = MagicMock()
+    adapter._ws.subscribe = AsyncMock()
+    adapter._ws.subscribe_channel.return_value = queue
+    adapter._ws.stream_error = None
+    await adapter.subscribe(["BTC-USDT-PERP"])
+
+    tickers = [ticker async for ticker in adapter.stream_tickers()]
+
+    assert [ticker.mark_price for ticker in tickers] == [
+        None,
+        Decimal("50001.5"),
+        Decimal("50002.0"),
+    ]
+    adapter._ws.unsubscribe_channel.assert_called_once_with(queue)
+
+
+@pytest.mark.asyncio
+async def test_stream_tickers_ignores_unsubscribed(
+    exchange_config, instrument_configs, okx_ticker_message
+):
+    """Test that tickers for unsubscribed instruments are not cached."""
+    unsubscribed = {
+        **okx_ticker_message,
+        "arg": {**okx_ticker_message["arg"], "instId": "DOGE-USDT-SWAP"},
+    }
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for message in (okx_ticker_message, unsubscribed, None):
+        queue.put_nowait(message)
+
+    adapter = OKXAdapter(exchange_config, instrument_configs)
+    adapter._ws = MagicMock()
+    adapter._ws.subscribe = AsyncMock()
+    adapter._ws.subscribe_channel.return_value = queue
+    adapter._ws.stream_error = None
+    await adapter.subscribe(["BTC-USDT-PERP"])
+
+    tickers = [ticker async for ticker in adapter.stream_tickers()]
+
+    assert len(tickers) == 1
+    assert list(adapter._ticker_cache) == [okx_ticker_message["arg"]["instId"]]
+
+
+@pytest.mark.asyncio
+async def test_stream_raises_client_error(exchange_config, instrument_configs):
+    """Test that a failure stopping the client's stream reaches the consumer."""
+    queue: asyncio.Queue = asyncio.Queue()
+    queue.put_nowait(None)
+
+    adapter = OKXAdapter(exchange_config, instrument_configs)
+    adapter._ws = MagicMock()
+    adapter._ws.subscribe = AsyncMock()
+    adapter._ws.subscribe_channel.return_value = queue
+    adapter._ws.stream_error = ConnectionError("Max reconnection attempts (0) exceeded")
+    await adapter.subscribe(["BTC-USDT-PERP"])
+
+    with pytest.raises(ConnectionError, match="Max reconnection attempts"):
+        async for _ in adapter.stream_order_books():
+            pass
+    adapter._ws.unsubscribe_channel.assert_called_once_with(queue)
+
+
+@pytest.mark.asyncio
+async def test_requires_connection(exchange_config, instrument_configs):
+    """Test that subscribe and streams fail fast when not connected."""
+    adapter = OKXAdapter(exchange_config, instrument_configs)
+
+    with pytest.raises(ConnectionError, match="Cannot subscribe"):
+        await adapter.subscribe(["BTC-USDT-PERP"])
+
+    with pytest.raises(ConnectionError, match="Cannot stream_order_books"):
+        await adapter.stream_order_books().__anext__()
+
+    with pytest.raises(ConnectionError, match="Cannot stream_tickers"):
+        await adapter.stream_tickers().__anext__()
+
+
 @pytest.mark.asyncio
 async def test_rest_fallback(exchange_config, instrument_configs):
     """Test REST fallback for order book."""